@@ -4,18 +4,19 @@ A powerful tool to find the best deals on Norway's largest marketplace
 """
 
 from flask import Flask, render_template, request, jsonify, send_file, Response
+from flask.json.provider import DefaultJSONProvider
 from flask_cors import CORS
 import requests
 from bs4 import BeautifulSoup
 import json
 import os
 from datetime import datetime, timedelta
-import hashlib
+import secrets
 import re
 from urllib.parse import urlencode, quote_plus
 import time
 import statistics
-from io import BytesIO
+from io import BytesIO, StringIO
 import csv
 from reportlab.lib import colors
 from reportlab.lib.pagesizes import A4
@@ -23,8 +24,40 @@ from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph,
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import inch
 import threading
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from collections import Counter, defaultdict
+from bisect import bisect_right
+
+from scraper import create_http_adapter
+
+logger = logging.getLogger(__name__)
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """Flask JSON provider that encodes responses with orjson"""
+    
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode('utf-8')
+    
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(
+            orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS),
+            mimetype=self.mimetype
+        )
+
 
 app = Flask(__name__)
+if orjson is not None:
+    # Optional: serialize large search payloads in C instead of stdlib json
+    app.json = OrjsonProvider(app)
 CORS(app)
 
 # Configuration
@@ -36,6 +69,35 @@ FAVORITES_FILE = os.path.join(DATA_DIR, 'favorites.json')
 # Ensure data directory exists
 os.makedirs(DATA_DIR, exist_ok=True)
 
+# PDF report styles, built once and shared by every export
+REPORT_DARK = colors.HexColor('#1a1a2e')
+REPORT_ACCENT = colors.HexColor('#667eea')
+REPORT_LIGHT = colors.HexColor('#f8f9fa')
+REPORT_GRID = colors.HexColor('#dee2e6')
+
+REPORT_STYLES = getSampleStyleSheet()
+REPORT_TITLE_STYLE = ParagraphStyle(
+    'CustomTitle',
+    parent=REPORT_STYLES['Heading1'],
+    fontSize=24,
+    spaceAfter=30,
+    textColor=REPORT_DARK
+)
+REPORT_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), REPORT_ACCENT),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, 0), 10),
+    ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+    ('BACKGROUND', (0, 1), (-1, -1), REPORT_LIGHT),
+    ('TEXTCOLOR', (0, 1), (-1, -1), REPORT_DARK),
+    ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
+    ('FONTSIZE', (0, 1), (-1, -1), 8),
+    ('GRID', (0, 0), (-1, -1), 1, REPORT_GRID),
+    ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, REPORT_LIGHT])
+])
+
 # Finn.no Categories and Subcategories
 FINN_CATEGORIES = {
     "torget": {
@@ -140,6 +202,85 @@ SORT_OPTIONS = {
     "date_asc": "Eldste først"
 }
 
+# finn.no query codes for condition and sort options
+CONDITION_CODES = {
+    'new': '1',
+    'as_new': '2',
+    'used': '3',
+    'for_parts': '4'
+}
+
+SORT_CODES = {
+    'price_asc': '2',
+    'price_desc': '3',
+    'date_desc': '1',
+    'date_asc': '4'
+}
+
+# Search parameters that affect the generated finn.no URL
+SEARCH_URL_PARAMS = (
+    'category', 'query', 'price_from', 'price_to', 'condition', 'sort',
+    'published_within', 'private_only', 'has_image', 'shipping'
+)
+
+# Precompiled patterns used while parsing listings
+LISTING_ID_RE = re.compile(r'/(\d+)(?:\?|$|#)')
+PRICE_DIGITS_RE = re.compile(r'\d+')
+# Thousands separators and spaces stripped from price text before matching
+PRICE_SEPARATORS = str.maketrans('', '', ' \xa0\u2009\u202f,.')
+
+# Common Norwegian words ignored when matching similar titles
+STOPWORDS = frozenset({
+    'og', 'i', 'på', 'til', 'for', 'med', 'av', 'en', 'et', 'den',
+    'det', 'de', 'som', 'er', 'var', 'har', 'kan', 'vil', 'skal'
+})
+
+
+def lookup_code(codes, value, default=None):
+    """Look up a request value in a code table, treating unhashable values as unknown"""
+    try:
+        return codes.get(value, default)
+    except TypeError:
+        return default
+
+
+@lru_cache(maxsize=None)
+def attr_contains(*substrings):
+    """Return a cached attribute matcher that checks for any of the substrings"""
+    def matcher(value):
+        if not value:
+            return False
+        value = str(value).lower()
+        return any(sub in value for sub in substrings)
+    return matcher
+
+
+class TTLCache:
+    """Small thread-safe cache whose entries expire after ttl seconds"""
+    
+    def __init__(self, maxsize, ttl):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries = {}
+        self._lock = threading.Lock()
+    
+    def get(self, key):
+        """Return the cached value, or None if missing or expired"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and entry[0] > time.monotonic():
+                return entry[1]
+            self._entries.pop(key, None)
+        return None
+    
+    def set(self, key, value):
+        """Store a value, evicting the oldest entry when full"""
+        with self._lock:
+            self._entries.pop(key, None)
+            if len(self._entries) >= self.maxsize:
+                self._entries.pop(next(iter(self._entries)))
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+
 
 class FinnScraper:
     """Scraper for finn.no marketplace"""
@@ -155,61 +296,63 @@ class FinnScraper:
             'Upgrade-Insecure-Requests': '1',
             'Cache-Control': 'max-age=0'
         })
+        adapter = create_http_adapter()
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        self._details_cache = TTLCache(maxsize=512, ttl=300)
         
     def build_search_url(self, params):
         """Build finn.no search URL from parameters"""
-        category = params.get('category', 'torget')
-        base_url = FINN_CATEGORIES.get(category, FINN_CATEGORIES['torget'])['url']
+        key = tuple(params.get(name) for name in SEARCH_URL_PARAMS)
+        try:
+            return self._build_search_url_cached(key)
+        except TypeError:
+            # Unhashable values (lists, dicts) can't be cached; build directly
+            return self._build_search_url_cached.__wrapped__(key)
+    
+    @staticmethod
+    @lru_cache(maxsize=512)
+    def _build_search_url_cached(key):
+        """Build the search URL for a tuple of SEARCH_URL_PARAMS values"""
+        params = dict(zip(SEARCH_URL_PARAMS, key))
+        base_url = lookup_code(FINN_CATEGORIES, params['category'], FINN_CATEGORIES['torget'])['url']
         
         query_params = {}
         
         # Search query
-        if params.get('query'):
+        if params['query']:
             query_params['q'] = params['query']
         
         # Price range
-        if params.get('price_from'):
+        if params['price_from']:
             query_params['price_from'] = params['price_from']
-        if params.get('price_to'):
+        if params['price_to']:
             query_params['price_to'] = params['price_to']
         
         # Condition
-        condition = params.get('condition', 'all')
-        if condition != 'all':
-            condition_map = {
-                'new': '1',
-                'as_new': '2', 
-                'used': '3',
-                'for_parts': '4'
-            }
-            if condition in condition_map:
-                query_params['condition'] = condition_map[condition]
+        condition = lookup_code(CONDITION_CODES, params['condition'])
+        if condition is not None:
+            query_params['condition'] = condition
         
         # Sort
-        sort = params.get('sort', 'relevance')
-        sort_map = {
-            'price_asc': '2',
-            'price_desc': '3',
-            'date_desc': '1',
-            'date_asc': '4'
-        }
-        if sort in sort_map:
-            query_params['sort'] = sort_map[sort]
+        sort = lookup_code(SORT_CODES, params['sort'])
+        if sort is not None:
+            query_params['sort'] = sort
         
         # Published within (days)
-        if params.get('published_within'):
+        if params['published_within']:
             query_params['published'] = params['published_within']
         
         # Private sellers only
-        if params.get('private_only'):
+        if params['private_only']:
             query_params['dealer_segment'] = '1'
         
         # Has image
-        if params.get('has_image'):
+        if params['has_image']:
             query_params['image'] = '1'
         
         # Shipping available (Fiks Ferdig)
-        if params.get('shipping'):
+        if params['shipping']:
             query_params['fiks_ferdig'] = '1'
         
         url = base_url
@@ -218,35 +361,56 @@ class FinnScraper:
         
         return url
     
+    def _page_url(self, url, page):
+        """Build the URL for a given results page"""
+        if page <= 1:
+            return url
+        separator = '&' if '?' in url else '?'
+        return f"{url}{separator}page={page}"
+    
+    def _fetch_page(self, page_url):
+        """Fetch a single results page, returning its raw HTML bytes or None on error"""
+        try:
+            response = self.session.get(page_url, timeout=15)
+            response.raise_for_status()
+            return response.content
+        except requests.RequestException as e:
+            logger.warning("Error scraping %s: %s", page_url, e)
+            return None
+    
     def scrape_listings(self, params, max_pages=3):
         """Scrape listings from finn.no"""
-        all_listings = []
+        if max_pages < 1:
+            return []
+        
         url = self.build_search_url(params)
+        category = params.get('category', 'torget')
         
-        for page in range(1, max_pages + 1):
-            page_url = url
-            if page > 1:
-                separator = '&' if '?' in url else '?'
-                page_url = f"{url}{separator}page={page}"
+        # Fetch page 1 alone so empty searches cost a single request
+        html = self._fetch_page(url)
+        if html is None:
+            return []
+        all_listings = self._parse_listings(BeautifulSoup(html, 'lxml'), category)
+        if not all_listings or max_pages == 1:
+            return all_listings
+        
+        # Fetch the remaining pages concurrently; map() keeps them in page order
+        page_urls = [self._page_url(url, page) for page in range(2, max_pages + 1)]
+        with ThreadPoolExecutor(max_workers=min(len(page_urls), 8)) as executor:
+            pages = list(executor.map(self._fetch_page, page_urls))
+        
+        # Parse in the calling thread so results stay deterministic
+        for html in pages:
+            if html is None:
+                break
             
-            try:
-                response = self.session.get(page_url, timeout=15)
-                response.raise_for_status()
-                
-                soup = BeautifulSoup(response.text, 'html.parser')
-                listings = self._parse_listings(soup, params.get('category', 'torget'))
-                
-                if not listings:
-                    break
-                    
-                all_listings.extend(listings)
-                
-                # Be respectful with rate limiting
-                time.sleep(0.5)
-                
-            except requests.RequestException as e:
-                print(f"Error scraping page {page}: {e}")
+            soup = BeautifulSoup(html, 'lxml')
+            listings = self._parse_listings(soup, category)
+            
+            if not listings:
                 break
+                
+            all_listings.extend(listings)
         
         return all_listings
     
@@ -255,11 +419,11 @@ class FinnScraper:
         listings = []
         
         # Find all article elements (finn.no listing cards)
-        articles = soup.find_all('article', class_=lambda x: x and ('ads__unit' in x or 'sf-search-ad' in x or 'a-card' in x))
+        articles = soup.find_all('article', class_=attr_contains('ads__unit', 'sf-search-ad', 'a-card'))
         
         # Alternative selectors
         if not articles:
-            articles = soup.find_all('a', class_=lambda x: x and 'sf-search-ad' in str(x))
+            articles = soup.find_all('a', class_=attr_contains('sf-search-ad'))
         
         if not articles:
             # Try finding by data attributes or other patterns
@@ -271,11 +435,53 @@ class FinnScraper:
                 if listing and listing.get('title'):
                     listings.append(listing)
             except Exception as e:
-                print(f"Error parsing listing: {e}")
+                logger.warning("Error parsing listing: %s", e)
                 continue
         
         return listings
     
+    def _find_listing_elements(self, article):
+        """Walk a listing card once and collect the first element for each field"""
+        found = {}
+        
+        def keep(key, node):
+            if key not in found:
+                found[key] = node
+        
+        for node in article.find_all(True):
+            name = node.name
+            classes = ' '.join(node.get('class') or ()).lower()
+            
+            if name == 'a':
+                if node.get('href') is not None:
+                    keep('link', node)
+                if 'sf-search-ad-link' in classes:
+                    keep('title_link', node)
+            elif name == 'img':
+                keep('img', node)
+            elif name == 'time':
+                keep('time', node)
+            
+            if name == 'span' and node.get('data-testid') == 'price':
+                keep('price_testid', node)
+            
+            if not classes:
+                continue
+            
+            if name in ('h2', 'h3', 'span') and ('heading' in classes or 'title' in classes):
+                keep('title', node)
+            if name in ('p', 'span') and ('description' in classes or 'subtitle' in classes):
+                keep('description', node)
+            if name in ('span', 'div'):
+                if 'price' in classes:
+                    keep('price_span' if name == 'span' else 'price_div', node)
+                if 'location' in classes or 'address' in classes:
+                    keep('location', node)
+                if 'fiks' in classes:
+                    keep('shipping', node)
+        
+        return found
+    
     def _parse_single_listing(self, article, category):
         """Parse a single listing element"""
         listing = {
@@ -294,8 +500,10 @@ class FinnScraper:
             'scraped_at': datetime.now().isoformat()
         }
         
+        elements = self._find_listing_elements(article)
+        
         # Extract link and ID
-        link = article.find('a', href=True)
+        link = elements.get('link')
         if link:
             href = link.get('href', '')
             if href:
@@ -305,60 +513,46 @@ class FinnScraper:
                     listing['listing_url'] = href
                 
                 # Extract ID from URL
-                id_match = re.search(r'/(\d+)(?:\?|$|#)', href)
+                id_match = LISTING_ID_RE.search(href)
                 if id_match:
                     listing['id'] = id_match.group(1)
         
         # Extract title
-        title_elem = article.find(['h2', 'h3', 'span'], class_=lambda x: x and ('heading' in str(x).lower() or 'title' in str(x).lower()))
-        if not title_elem:
-            title_elem = article.find('a', class_=lambda x: x and 'sf-search-ad-link' in str(x))
+        title_elem = elements.get('title') or elements.get('title_link')
         if title_elem:
             listing['title'] = title_elem.get_text(strip=True)
         
         # Extract price
-        price_selectors = [
-            ('span', {'class': lambda x: x and 'price' in str(x).lower()}),
-            ('span', {'data-testid': 'price'}),
-            ('div', {'class': lambda x: x and 'price' in str(x).lower()})
-        ]
-        
-        for tag, attrs in price_selectors:
-            price_elem = article.find(tag, attrs)
-            if price_elem:
-                price_text = price_elem.get_text(strip=True)
-                listing['price'] = price_text
-                # Extract numeric price
-                price_match = re.search(r'([\d\s]+)', price_text.replace(' ', '').replace('\xa0', ''))
-                if price_match:
-                    try:
-                        listing['price_numeric'] = int(price_match.group(1).replace(' ', ''))
-                    except ValueError:
-                        pass
-                break
+        price_elem = elements.get('price_span') or elements.get('price_testid') or elements.get('price_div')
+        if price_elem:
+            price_text = price_elem.get_text(strip=True)
+            listing['price'] = price_text
+            # Extract numeric price
+            price_match = PRICE_DIGITS_RE.search(price_text.translate(PRICE_SEPARATORS))
+            if price_match:
+                listing['price_numeric'] = int(price_match.group())
         
         # Extract location
-        location_elem = article.find(['span', 'div'], class_=lambda x: x and ('location' in str(x).lower() or 'address' in str(x).lower()))
+        location_elem = elements.get('location')
         if location_elem:
             listing['location'] = location_elem.get_text(strip=True)
         
         # Extract image
-        img = article.find('img')
+        img = elements.get('img')
         if img:
             listing['image_url'] = img.get('src') or img.get('data-src') or img.get('srcset', '').split()[0]
         
         # Extract description/subtitle
-        desc_elem = article.find(['p', 'span'], class_=lambda x: x and ('description' in str(x).lower() or 'subtitle' in str(x).lower()))
+        desc_elem = elements.get('description')
         if desc_elem:
             listing['description'] = desc_elem.get_text(strip=True)
         
         # Check for shipping badge (Fiks Ferdig)
-        shipping_badge = article.find(['span', 'div'], class_=lambda x: x and 'fiks' in str(x).lower())
-        if shipping_badge:
+        if elements.get('shipping'):
             listing['shipping_available'] = True
         
         # Extract published time
-        time_elem = article.find('time')
+        time_elem = elements.get('time')
         if time_elem:
             listing['published'] = time_elem.get('datetime') or time_elem.get_text(strip=True)
         
@@ -366,10 +560,14 @@ class FinnScraper:
     
     def get_listing_details(self, listing_url):
         """Get detailed information for a single listing"""
+        cached = self._details_cache.get(listing_url)
+        if cached is not None:
+            return cached
+        
         try:
             response = self.session.get(listing_url, timeout=15)
             response.raise_for_status()
-            soup = BeautifulSoup(response.text, 'html.parser')
+            soup = BeautifulSoup(response.content, 'lxml')
             
             details = {
                 'full_description': None,
@@ -380,26 +578,27 @@ class FinnScraper:
             }
             
             # Get full description
-            desc_elem = soup.find(['div', 'p'], class_=lambda x: x and 'description' in str(x).lower())
+            desc_elem = soup.find(['div', 'p'], class_=attr_contains('description'))
             if desc_elem:
                 details['full_description'] = desc_elem.get_text(strip=True)
             
             # Get all images
-            gallery = soup.find_all('img', src=lambda x: x and 'images.finncdn.no' in str(x))
+            gallery = soup.find_all('img', src=attr_contains('images.finncdn.no'))
             for img in gallery:
                 src = img.get('src')
                 if src:
                     details['all_images'].append(src)
             
             # Get seller info
-            seller_elem = soup.find(['div', 'span'], class_=lambda x: x and 'seller' in str(x).lower())
+            seller_elem = soup.find(['div', 'span'], class_=attr_contains('seller'))
             if seller_elem:
                 details['seller_info'] = seller_elem.get_text(strip=True)
             
+            self._details_cache.set(listing_url, details)
             return details
             
         except Exception as e:
-            print(f"Error getting listing details: {e}")
+            logger.warning("Error getting listing details: %s", e)
             return None
 
 
@@ -412,17 +611,21 @@ class DealAnalyzer:
         if not listing.get('price_numeric') or not similar_listings:
             return None
         
-        prices = [l['price_numeric'] for l in similar_listings if l.get('price_numeric')]
+        prices = sorted(l['price_numeric'] for l in similar_listings if l.get('price_numeric'))
+        return DealAnalyzer._score_against_prices(listing['price_numeric'], prices)
+    
+    @staticmethod
+    def _score_against_prices(current_price, prices):
+        """Score a price against an already sorted list of comparable prices"""
         if len(prices) < 2:
             return None
         
-        avg_price = statistics.mean(prices)
-        min_price = min(prices)
-        max_price = max(prices)
-        current_price = listing['price_numeric']
+        avg_price = sum(prices) / len(prices)
+        min_price = prices[0]
+        max_price = prices[-1]
         
         # Calculate percentile (lower is better)
-        below_count = sum(1 for p in prices if p > current_price)
+        below_count = len(prices) - bisect_right(prices, current_price)
         percentile = (below_count / len(prices)) * 100
         
         # Calculate savings percentage
@@ -449,10 +652,7 @@ class DealAnalyzer:
         if not listing.get('title'):
             return []
         
-        keywords = set(listing['title'].lower().split())
-        # Remove common words
-        stopwords = {'og', 'i', 'på', 'til', 'for', 'med', 'av', 'en', 'et', 'den', 'det', 'de', 'som', 'er', 'var', 'har', 'kan', 'vil', 'skal'}
-        keywords = keywords - stopwords
+        keywords = set(listing['title'].lower().split()) - STOPWORDS
         
         similar = []
         for other in all_listings:
@@ -469,16 +669,42 @@ class DealAnalyzer:
     
     @staticmethod
     def rank_deals(listings):
-        """Rank all listings by deal quality"""
+        """Rank all listings by deal quality
+        
+        Each listing dict is updated in place with a 'deal_analysis' key;
+        the returned list holds the same dicts sorted by deal score.
+        """
         ranked = []
         
-        for listing in listings:
-            similar = DealAnalyzer.find_similar_listings(listing, listings)
-            analysis = DealAnalyzer.calculate_deal_score(listing, similar)
+        # Tokenize every title once and index listings by keyword
+        tokens = [
+            frozenset(l['title'].lower().split()) - STOPWORDS if l.get('title') else frozenset()
+            for l in listings
+        ]
+        prices = [l.get('price_numeric') for l in listings]
+        keyword_index = defaultdict(list)
+        for i, keywords in enumerate(tokens):
+            for word in keywords:
+                keyword_index[word].append(i)
+        
+        for i, listing in enumerate(listings):
+            analysis = None
+            current_price = prices[i]
+            if current_price:
+                # Count shared keywords with every other listing via the index
+                overlaps = Counter()
+                for word in tokens[i]:
+                    overlaps.update(keyword_index[word])
+                
+                similar_prices = sorted(
+                    prices[j] for j in overlaps
+                    if overlaps[j] >= 2 and prices[j]
+                    and listings[j].get('id') != listing.get('id')
+                )
+                analysis = DealAnalyzer._score_against_prices(current_price, similar_prices)
             
-            listing_copy = listing.copy()
-            listing_copy['deal_analysis'] = analysis
-            ranked.append(listing_copy)
+            listing['deal_analysis'] = analysis
+            ranked.append(listing)
         
         # Sort by deal score (highest first)
         ranked.sort(key=lambda x: (x.get('deal_analysis', {}) or {}).get('score', 0), reverse=True)
@@ -491,29 +717,97 @@ scraper = FinnScraper()
 analyzer = DealAnalyzer()
 
 
+# Short-lived cache of search responses so re-submitted searches skip finn.no
+search_cache = TTLCache(maxsize=256, ttl=120)
+
+
 # Utility functions for data persistence
+# Writes are debounced: rapid successive saves of the same file collapse into
+# a single atomic disk write once SAVE_DEBOUNCE_SECONDS have passed.
+SAVE_DEBOUNCE_SECONDS = 0.5
+# Delay before retrying a write that failed; the payload stays pending meanwhile
+SAVE_RETRY_SECONDS = 5
+_pending_writes = {}
+_write_timers = {}
+_write_lock = threading.Lock()
+# Serializes disk writes so _write_lock is never held across file I/O
+_flush_lock = threading.Lock()
+
+# Parsed file contents keyed by path, invalidated when the file's mtime changes
+_json_cache = {}
+
+
 def load_json_file(filepath, default=None):
     """Load JSON file with default fallback"""
     if default is None:
         default = {}
+    with _write_lock:
+        if filepath in _pending_writes:
+            return _pending_writes[filepath].copy()
+    try:
+        mtime = os.stat(filepath).st_mtime_ns
+    except OSError:
+        return default
+    cached = _json_cache.get(filepath)
+    if cached and cached[0] == mtime:
+        return cached[1].copy()
     try:
-        if os.path.exists(filepath):
-            with open(filepath, 'r', encoding='utf-8') as f:
-                return json.load(f)
+        with open(filepath, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        _json_cache[filepath] = (mtime, data)
+        return data.copy()
     except Exception as e:
-        print(f"Error loading {filepath}: {e}")
+        logger.warning("Error loading %s: %s", filepath, e)
     return default
 
 
+def _dump_json_bytes(data):
+    """Serialize data for disk, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, ensure_ascii=False).encode('utf-8')
+
+
+def _schedule_flush(filepath, delay):
+    """Start a flush timer for filepath unless one is already pending (caller holds _write_lock)"""
+    if filepath not in _write_timers:
+        timer = threading.Timer(delay, _flush_json_file, args=(filepath,))
+        _write_timers[filepath] = timer
+        timer.start()
+
+
+def _flush_json_file(filepath):
+    """Atomically write any pending data for filepath to disk"""
+    with _flush_lock:
+        with _write_lock:
+            _write_timers.pop(filepath, None)
+            if filepath not in _pending_writes:
+                return
+            data = _pending_writes.pop(filepath)
+        tmp_path = f"{filepath}.tmp"
+        try:
+            with open(tmp_path, 'wb') as f:
+                f.write(_dump_json_bytes(data))
+            os.replace(tmp_path, filepath)
+            mtime = os.stat(filepath).st_mtime_ns
+        except Exception as e:
+            logger.warning("Error saving %s, retrying in %ss: %s", filepath, SAVE_RETRY_SECONDS, e)
+            with _write_lock:
+                _json_cache.pop(filepath, None)
+                # Keep the payload for retry unless a newer save replaced it
+                _pending_writes.setdefault(filepath, data)
+                _schedule_flush(filepath, SAVE_RETRY_SECONDS)
+            return
+        with _write_lock:
+            _json_cache[filepath] = (mtime, data)
+
+
 def save_json_file(filepath, data):
-    """Save data to JSON file"""
-    try:
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
-        return True
-    except Exception as e:
-        print(f"Error saving {filepath}: {e}")
-        return False
+    """Schedule data to be saved to JSON file"""
+    with _write_lock:
+        _pending_writes[filepath] = data
+        _schedule_flush(filepath, SAVE_DEBOUNCE_SECONDS)
+    return True
 
 
 # Flask Routes
@@ -537,9 +831,16 @@ def get_categories():
 def search():
     """Search finn.no and analyze deals"""
     params = request.json
+    max_pages = params.get('max_pages', 3)
+    search_url = scraper.build_search_url(params)
+    
+    cache_key = (search_url, max_pages)
+    cached = search_cache.get(cache_key)
+    if cached is not None:
+        return jsonify(cached)
     
     # Scrape listings
-    listings = scraper.scrape_listings(params, max_pages=params.get('max_pages', 3))
+    listings = scraper.scrape_listings(params, max_pages=max_pages)
     
     # Analyze deals
     ranked_listings = analyzer.rank_deals(listings)
@@ -557,12 +858,15 @@ def search():
         'good_deals': sum(1 for l in ranked_listings if (l.get('deal_analysis') or {}).get('is_good_deal'))
     }
     
-    return jsonify({
+    response_data = {
         'success': True,
         'listings': ranked_listings,
         'summary': summary,
-        'search_url': scraper.build_search_url(params)
-    })
+        'search_url': search_url
+    }
+    search_cache.set(cache_key, response_data)
+    
+    return jsonify(response_data)
 
 
 @app.route('/api/saved-searches', methods=['GET'])
@@ -576,7 +880,7 @@ def get_saved_searches():
 def save_search():
     """Save a new search"""
     search_data = request.json
-    search_data['id'] = hashlib.md5(str(datetime.now().timestamp()).encode()).hexdigest()[:8]
+    search_data['id'] = secrets.token_hex(4)
     search_data['created_at'] = datetime.now().isoformat()
     
     searches = load_json_file(SEARCHES_FILE, [])
@@ -634,63 +938,48 @@ def export_csv():
     """Export listings to CSV"""
     listings = request.json.get('listings', [])
     
-    output = BytesIO()
-    output.write('\ufeff'.encode('utf-8'))  # BOM for Excel
+    output = StringIO()
+    output.write('\ufeff')  # BOM for Excel
     
     fieldnames = ['title', 'price', 'location', 'condition', 'listing_url', 'deal_score', 'avg_price', 'savings']
-    writer = csv.DictWriter(output, fieldnames=fieldnames, extrasaction='ignore')
-    
-    output.write(','.join(fieldnames).encode('utf-8') + b'\n')
-    
-    for listing in listings:
-        row = {
-            'title': listing.get('title', ''),
-            'price': listing.get('price', ''),
-            'location': listing.get('location', ''),
-            'condition': listing.get('condition', ''),
-            'listing_url': listing.get('listing_url', ''),
-            'deal_score': (listing.get('deal_analysis') or {}).get('score', ''),
-            'avg_price': (listing.get('deal_analysis') or {}).get('avg_price', ''),
-            'savings': (listing.get('deal_analysis') or {}).get('savings_amount', '')
-        }
-        row_str = ','.join([f'"{str(v)}"' for v in row.values()])
-        output.write(row_str.encode('utf-8') + b'\n')
+    writer = csv.writer(output, quoting=csv.QUOTE_MINIMAL)
+    writer.writerow(fieldnames)
     
-    output.seek(0)
+    def listing_row(listing):
+        analysis = listing.get('deal_analysis') or {}
+        return (
+            listing.get('title', ''),
+            listing.get('price', ''),
+            listing.get('location', ''),
+            listing.get('condition', ''),
+            listing.get('listing_url', ''),
+            analysis.get('score', ''),
+            analysis.get('avg_price', ''),
+            analysis.get('savings_amount', '')
+        )
+    
+    writer.writerows(listing_row(listing) for listing in listings)
     
     return Response(
-        output.getvalue(),
+        output.getvalue().encode('utf-8'),
         mimetype='text/csv',
         headers={'Content-Disposition': f'attachment; filename=finn_deals_{datetime.now().strftime("%Y%m%d_%H%M%S")}.csv'}
     )
 
 
-@app.route('/api/export/pdf', methods=['POST'])
-def export_pdf():
-    """Export listings to PDF"""
-    data = request.json
-    listings = data.get('listings', [])
-    search_params = data.get('search_params', {})
-    
+def build_pdf_report(listings, search_params):
+    """Render the PDF deal report and return it as bytes"""
     buffer = BytesIO()
     doc = SimpleDocTemplate(buffer, pagesize=A4, rightMargin=30, leftMargin=30, topMargin=30, bottomMargin=30)
     
     elements = []
-    styles = getSampleStyleSheet()
     
     # Title
-    title_style = ParagraphStyle(
-        'CustomTitle',
-        parent=styles['Heading1'],
-        fontSize=24,
-        spaceAfter=30,
-        textColor=colors.HexColor('#1a1a2e')
-    )
-    elements.append(Paragraph("🔍 Finn.no Deal Finder Report", title_style))
+    elements.append(Paragraph("🔍 Finn.no Deal Finder Report", REPORT_TITLE_STYLE))
     
     # Search info
     search_info = f"Search: {search_params.get('query', 'All items')} | Generated: {datetime.now().strftime('%Y-%m-%d %H:%M')}"
-    elements.append(Paragraph(search_info, styles['Normal']))
+    elements.append(Paragraph(search_info, REPORT_STYLES['Normal']))
     elements.append(Spacer(1, 20))
     
     # Summary stats
@@ -698,7 +987,7 @@ def export_pdf():
         prices = [l['price_numeric'] for l in listings if l.get('price_numeric')]
         if prices:
             summary = f"Found {len(listings)} items | Avg price: {int(statistics.mean(prices)):,} kr | Price range: {min(prices):,} - {max(prices):,} kr"
-            elements.append(Paragraph(summary, styles['Normal']))
+            elements.append(Paragraph(summary, REPORT_STYLES['Normal']))
             elements.append(Spacer(1, 20))
     
     # Table data
@@ -719,28 +1008,26 @@ def export_pdf():
         ])
     
     table = Table(table_data, colWidths=[30, 200, 80, 70, 50])
-    table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#667eea')),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, 0), 10),
-        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-        ('BACKGROUND', (0, 1), (-1, -1), colors.HexColor('#f8f9fa')),
-        ('TEXTCOLOR', (0, 1), (-1, -1), colors.HexColor('#1a1a2e')),
-        ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
-        ('FONTSIZE', (0, 1), (-1, -1), 8),
-        ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#dee2e6')),
-        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#f8f9fa')])
-    ]))
+    table.setStyle(REPORT_TABLE_STYLE)
     
     elements.append(table)
     
     doc.build(elements)
-    buffer.seek(0)
+    return buffer.getvalue()
+
+
+@app.route('/api/export/pdf', methods=['POST'])
+def export_pdf():
+    """Export listings to PDF"""
+    data = request.json
+    listings = data.get('listings', [])
+    search_params = data.get('search_params', {})
+    
+    pdf_data = build_pdf_report(listings, search_params)
     
+    # Sent as bytes so the response carries Content-Length for download progress
     return Response(
-        buffer.getvalue(),
+        pdf_data,
         mimetype='application/pdf',
         headers={'Content-Disposition': f'attachment; filename=finn_deals_{datetime.now().strftime("%Y%m%d_%H%M%S")}.pdf'}
     )
@@ -756,4 +1043,5 @@ def generate_print_view():
 
 
 if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO)
     app.run(debug=True, port=5000)
@@ -6,11 +6,186 @@ Handles saving and loading of search criteria, results, and price history
 
 import json
 import os
-from datetime import datetime
+from array import array
+from datetime import datetime, timedelta, timezone
+from types import MappingProxyType
 from typing import List, Dict, Any, Optional
+import queue
 import sqlite3
+import threading
+import time
+import zlib
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+if orjson is not None:
+    def _dumps(obj: Any) -> str:
+        """Serialize obj to a JSON string"""
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode('utf-8')
+    
+    def _dumps_indented(obj: Any) -> bytes:
+        """Serialize obj to indented UTF-8 JSON for files"""
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    
+    _loads = orjson.loads
+else:
+    def _dumps(obj: Any) -> str:
+        """Serialize obj to a JSON string"""
+        return json.dumps(obj, ensure_ascii=False)
+    
+    def _dumps_indented(obj: Any) -> bytes:
+        """Serialize obj to indented UTF-8 JSON for files"""
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+    
+    _loads = json.loads
+
+
+# Stored result lists are highly repetitive JSON, so they are kept as
+# zlib-compressed BLOBs. Rows written before this was introduced are still
+# plain TEXT and are decoded as-is.
+RESULTS_COMPRESSION_LEVEL = 6
+
+
+def _pack_results(obj: Any) -> bytes:
+    """Serialize and compress obj for a BLOB column"""
+    return zlib.compress(_dumps(obj).encode('utf-8'), RESULTS_COMPRESSION_LEVEL)
+
+
+def _unpack_results(data) -> Any:
+    """Decode a value written by _pack_results or a legacy JSON string"""
+    if isinstance(data, bytes):
+        data = zlib.decompress(data)
+    return _loads(data)
+
+
+# SQL for frequently executed statements. Keeping the text identical lets the
+# sqlite3 statement cache reuse the prepared statement on the persistent
+# connection instead of re-parsing it on every call.
+INSERT_PRICE_HISTORY_SQL = '''
+    INSERT INTO price_history 
+    (finn_id, title, price, url, category, location, condition)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+'''
+
+# Multi-row form used for full batches of price history; 100 rows of 7
+# columns stays under SQLite's historical 999 bound-parameter limit
+PRICE_HISTORY_BATCH_ROWS = 100
+INSERT_PRICE_HISTORY_BATCH_SQL = (
+    'INSERT INTO price_history '
+    '(finn_id, title, price, url, category, location, condition) VALUES '
+    + ', '.join(['(?, ?, ?, ?, ?, ?, ?)'] * PRICE_HISTORY_BATCH_ROWS)
+)
+
+# Upsert updates an existing bookmark in place, keeping its rowid and
+# original saved_at instead of deleting and re-inserting the row
+INSERT_SAVED_ITEM_SQL = '''
+    INSERT INTO saved_items
+    (finn_id, title, price, url, category, location, condition, deal_score, notes)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(finn_id) DO UPDATE SET
+        title = excluded.title,
+        price = excluded.price,
+        url = excluded.url,
+        category = excluded.category,
+        location = excluded.location,
+        condition = excluded.condition,
+        deal_score = excluded.deal_score,
+        notes = excluded.notes,
+        last_updated = CURRENT_TIMESTAMP
+'''
+
+DELETE_SAVED_ITEM_SQL = 'DELETE FROM saved_items WHERE finn_id = ?'
+
+INSERT_SEARCH_RESULTS_SQL = '''
+    INSERT INTO search_results (search_name, search_params, results_json)
+    VALUES (?, ?, ?)
+'''
+
+# Read-only defaults, built once at import; callers get copies
+DEFAULT_SETTINGS = MappingProxyType({
+    'theme': 'dark',
+    'language': 'no',
+    'max_concurrent_requests': 5,
+    'request_delay_min': 0.5,
+    'request_delay_max': 1.5,
+    'default_max_results': 50,
+    'default_deal_threshold': 70,
+    'auto_save_results': True,
+    'notifications_enabled': False,
+    'proxy_enabled': False,
+    'proxy_url': '',
+    'export_directory': str(Path.home() / 'Downloads'),
+})
+
+# All counters for get_statistics in a single statement
+STATISTICS_SQL = '''
+    SELECT
+        (SELECT COUNT(*) FROM price_history),
+        (SELECT COUNT(*) FROM saved_items),
+        (SELECT COUNT(*) FROM search_results),
+        (SELECT COUNT(DISTINCT finn_id) FROM price_history)
+'''
+
+# Secondary price_history indexes, keyed by name. cleanup_old_data drops and
+# rebuilds these around large deletes; the timestamp index is left out
+# because the delete itself searches on it.
+PRICE_HISTORY_INDEXES = {
+    # (finn_id, timestamp) serves get_price_history's filter and ORDER BY
+    'idx_price_history_finn_id_timestamp': '''
+        CREATE INDEX IF NOT EXISTS idx_price_history_finn_id_timestamp 
+        ON price_history(finn_id, timestamp)
+    ''',
+}
+
+# Write-behind for price history: the writer thread commits once it has
+# this many rows queued or the oldest queued row has waited this long
+PRICE_HISTORY_FLUSH_ROWS = 500
+PRICE_HISTORY_FLUSH_INTERVAL = 1.0
+
+# Queue markers for the price history writer thread
+_FLUSH = object()
+_STOP = object()
+
+# Rebuilding indexes only pays off when a large share of the table goes
+CLEANUP_REBUILD_MIN_ROWS = 10000
+CLEANUP_REBUILD_RATIO = 0.3
+
+INSERT_SAVED_SEARCH_SQL = 'INSERT INTO saved_searches (data, saved_at) VALUES (?, ?)'
+
+# Saved searches are addressed by their position in the list shown to the user
+SAVED_SEARCH_AT_INDEX_SQL = '''
+    SELECT id FROM saved_searches ORDER BY id LIMIT 1 OFFSET ?
+'''
+
+
+def _cutoff_date(days: int) -> str:
+    """Return the UTC date `days` ago, matching CURRENT_TIMESTAMP's clock"""
+    return (datetime.now(timezone.utc) - timedelta(days=days)).strftime('%Y-%m-%d')
+
+
+def _make_row_factory(keys: tuple):
+    """
+    Build a cursor row factory that returns dicts with a fixed key set
+    
+    The factory is generated once as a dict literal specialised to keys,
+    which is cheaper per row than dict(sqlite3.Row) or dict(zip(...)).
+    """
+    body = ', '.join(f'{key!r}: row[{i}]' for i, key in enumerate(keys))
+    return eval(f'lambda cursor, row: {{{body}}}')
+
+
+PRICE_HISTORY_ROW = _make_row_factory(('price', 'timestamp', 'title', 'location', 'condition'))
+
+SAVED_ITEM_ROW = _make_row_factory((
+    'id', 'title', 'price', 'url', 'category', 'location',
+    'condition', 'deal_score', 'notes', 'saved_at', 'last_updated'
+))
+
 
 class DataManager:
     """Manages persistent data storage for the application"""
@@ -36,14 +211,68 @@ class DataManager:
         self.settings_file = self.data_dir / 'settings.json'
         self.db_file = self.data_dir / 'finn_data.db'
         
+        # One long-lived connection per thread, reused across calls
+        self._local = threading.local()
+        self._connections = []
+        self._connections_lock = threading.Lock()
+        
+        # Price history is queued here and committed by a background writer
+        # so callers never wait on the database
+        self._history_queue = queue.Queue()
+        self._history_writer = None
+        self._history_writer_lock = threading.Lock()
+        
+        # Last settings payload written to disk, used to skip no-op saves
+        self._settings_written = None
+        
         # Initialize database
         self._init_database()
+        self._migrate_saved_searches_file()
+        
+    def _connect(self) -> sqlite3.Connection:
+        """Return the calling thread's persistent database connection"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_file, check_same_thread=False)
+            conn.row_factory = sqlite3.Row
+            conn.execute('PRAGMA synchronous=NORMAL')
+            conn.execute('PRAGMA temp_store=MEMORY')
+            conn.execute('PRAGMA cache_size=-20000')
+            conn.execute('PRAGMA mmap_size=268435456')
+            self._local.conn = conn
+            with self._connections_lock:
+                self._connections.append(conn)
+        return conn
+        
+    def flush(self):
+        """Block until all queued price history has been committed"""
+        writer = self._history_writer
+        if writer is not None and writer.is_alive():
+            self._history_queue.put(_FLUSH)
+            self._history_queue.join()
+            
+    def close(self):
+        """Flush pending writes and close every database connection"""
+        with self._history_writer_lock:
+            writer, self._history_writer = self._history_writer, None
+        if writer is not None and writer.is_alive():
+            self._history_queue.put(_STOP)
+            writer.join()
+        
+        with self._connections_lock:
+            for conn in self._connections:
+                conn.close()
+            self._connections.clear()
+        self._local = threading.local()
         
     def _init_database(self):
         """Initialize SQLite database for price history"""
-        conn = sqlite3.connect(self.db_file)
+        conn = self._connect()
         cursor = conn.cursor()
         
+        # WAL is persistent, so it only needs to be enabled once per file
+        cursor.execute('PRAGMA journal_mode=WAL')
+        
         # Create tables
         cursor.execute('''
             CREATE TABLE IF NOT EXISTS price_history (
@@ -55,10 +284,21 @@ class DataManager:
                 url TEXT,
                 category TEXT,
                 location TEXT,
-                condition TEXT
+                condition TEXT,
+                date_day TEXT GENERATED ALWAYS AS (date(timestamp)) VIRTUAL
             )
         ''')
         
+        # Databases created before date_day existed get it added in place;
+        # ALTER TABLE only supports VIRTUAL generated columns, so both paths
+        # use VIRTUAL and rely on the index below to materialize the value
+        columns = {row[1] for row in cursor.execute('PRAGMA table_xinfo(price_history)')}
+        if 'date_day' not in columns:
+            cursor.execute('''
+                ALTER TABLE price_history 
+                ADD COLUMN date_day TEXT GENERATED ALWAYS AS (date(timestamp)) VIRTUAL
+            ''')
+        
         cursor.execute('''
             CREATE TABLE IF NOT EXISTS saved_items (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -81,15 +321,73 @@ class DataManager:
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
                 search_name TEXT,
                 search_params TEXT,
-                results_json TEXT,
+                results_json BLOB,
                 created_at DATETIME DEFAULT CURRENT_TIMESTAMP
             )
         ''')
         
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS saved_searches (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                data TEXT NOT NULL,
+                saved_at DATETIME DEFAULT CURRENT_TIMESTAMP
+            )
+        ''')
+        
+        # Per-day price rollup that get_price_trends reads instead of
+        # aggregating price_history on every call. A trigger keeps it in
+        # step with inserts; cleanup_old_data prunes it by day.
+        rollup_exists = cursor.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'price_daily'"
+        ).fetchone()
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS price_daily (
+                category TEXT,
+                day TEXT NOT NULL,
+                row_count INTEGER NOT NULL,
+                price_sum INTEGER,
+                price_count INTEGER NOT NULL,
+                min_price INTEGER,
+                max_price INTEGER,
+                PRIMARY KEY (category, day)
+            )
+        ''')
+        if not rollup_exists:
+            cursor.execute('''
+                INSERT INTO price_daily
+                SELECT category, date_day, COUNT(*), SUM(price), COUNT(price), MIN(price), MAX(price)
+                FROM price_history
+                GROUP BY category, date_day
+            ''')
+        
+        cursor.execute('''
+            CREATE TRIGGER IF NOT EXISTS trg_price_daily_insert
+            AFTER INSERT ON price_history
+            BEGIN
+                INSERT INTO price_daily
+                (category, day, row_count, price_sum, price_count, min_price, max_price)
+                VALUES (NEW.category, NEW.date_day, 1, NEW.price, NEW.price IS NOT NULL,
+                        NEW.price, NEW.price)
+                ON CONFLICT(category, day) DO UPDATE SET
+                    row_count = row_count + 1,
+                    price_sum = COALESCE(price_sum + excluded.price_sum, price_sum, excluded.price_sum),
+                    price_count = price_count + excluded.price_count,
+                    min_price = COALESCE(MIN(min_price, excluded.min_price), min_price, excluded.min_price),
+                    max_price = COALESCE(MAX(max_price, excluded.max_price), max_price, excluded.max_price);
+            END
+        ''')
+        
         # Create indexes
+        # Superseded by the composite index in PRICE_HISTORY_INDEXES and,
+        # for trends, by the price_daily rollup
+        cursor.execute('DROP INDEX IF EXISTS idx_price_history_finn_id')
+        cursor.execute('DROP INDEX IF EXISTS idx_price_history_category_timestamp')
+        cursor.execute('DROP INDEX IF EXISTS idx_price_history_category_day')
+        cursor.execute('DROP INDEX IF EXISTS idx_price_history_day')
+        
         cursor.execute('''
-            CREATE INDEX IF NOT EXISTS idx_price_history_finn_id 
-            ON price_history(finn_id)
+            CREATE INDEX IF NOT EXISTS idx_price_daily_day 
+            ON price_daily(day)
         ''')
         
         cursor.execute('''
@@ -97,99 +395,227 @@ class DataManager:
             ON price_history(timestamp)
         ''')
         
+        for create_sql in PRICE_HISTORY_INDEXES.values():
+            cursor.execute(create_sql)
+        
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_saved_items_saved_at 
+            ON saved_items(saved_at DESC)
+        ''')
+        
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_search_results_created_at 
+            ON search_results(created_at DESC)
+        ''')
+        
         conn.commit()
-        conn.close()
         
-    def load_saved_searches(self) -> List[Dict]:
-        """Load saved search criteria from file"""
+    def _migrate_saved_searches_file(self):
+        """Import searches from the legacy JSON file into the database once"""
         if not self.searches_file.exists():
-            return []
+            return
         
         try:
-            with open(self.searches_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            with open(self.searches_file, 'rb') as f:
+                searches = _loads(f.read())
         except (json.JSONDecodeError, IOError) as e:
+            print(f"Error migrating saved searches: {e}")
+            return
+        
+        conn = self._connect()
+        try:
+            with conn:
+                count = conn.execute('SELECT COUNT(*) FROM saved_searches').fetchone()[0]
+                if count == 0:
+                    conn.executemany(
+                        INSERT_SAVED_SEARCH_SQL,
+                        [self._saved_search_row(search) for search in searches]
+                    )
+            self.searches_file.replace(self.searches_file.with_suffix('.json.migrated'))
+        except (sqlite3.Error, OSError) as e:
+            print(f"Error migrating saved searches: {e}")
+            
+    @staticmethod
+    def _saved_search_row(search_data: Dict) -> tuple:
+        """Build the saved_searches row for a search"""
+        return (
+            _dumps(search_data),
+            search_data.get('saved_at') or datetime.now().isoformat()
+        )
+        
+    def load_saved_searches(self) -> List[Dict]:
+        """Load saved search criteria from the database"""
+        try:
+            conn = self._connect()
+            cursor = conn.execute('SELECT data FROM saved_searches ORDER BY id')
+            return [_loads(row[0]) for row in cursor]
+        except (json.JSONDecodeError, sqlite3.Error) as e:
             print(f"Error loading saved searches: {e}")
             return []
             
     def save_searches(self, searches: List[Dict]):
-        """Save search criteria to file"""
+        """Replace all saved search criteria in a single transaction"""
+        conn = self._connect()
         try:
-            with open(self.searches_file, 'w', encoding='utf-8') as f:
-                json.dump(searches, f, indent=2, ensure_ascii=False)
-        except IOError as e:
+            with conn:
+                conn.execute('DELETE FROM saved_searches')
+                conn.executemany(
+                    INSERT_SAVED_SEARCH_SQL,
+                    [self._saved_search_row(search) for search in searches]
+                )
+        except sqlite3.Error as e:
             print(f"Error saving searches: {e}")
             raise
             
     def add_saved_search(self, search_data: Dict) -> bool:
         """Add a new saved search"""
-        searches = self.load_saved_searches()
+        conn = self._connect()
         
         # Add timestamp if not present
         if 'saved_at' not in search_data:
             search_data['saved_at'] = datetime.now().isoformat()
         
-        # Generate ID if not present
-        if 'id' not in search_data:
-            search_data['id'] = f"search_{len(searches) + 1}_{datetime.now().strftime('%Y%m%d%H%M%S')}"
-        
-        searches.append(search_data)
-        self.save_searches(searches)
-        return True
+        try:
+            with conn:
+                # Generate ID if not present
+                if 'id' not in search_data:
+                    count = conn.execute('SELECT COUNT(*) FROM saved_searches').fetchone()[0]
+                    search_data['id'] = f"search_{count + 1}_{datetime.now().strftime('%Y%m%d%H%M%S')}"
+                
+                conn.execute(INSERT_SAVED_SEARCH_SQL, self._saved_search_row(search_data))
+            return True
+        except sqlite3.Error as e:
+            print(f"Error adding saved search: {e}")
+            return False
         
     def delete_saved_search(self, index: int) -> bool:
         """Delete a saved search by index"""
-        searches = self.load_saved_searches()
+        if index < 0:
+            return False
         
-        if 0 <= index < len(searches):
-            del searches[index]
-            self.save_searches(searches)
-            return True
-        
-        return False
+        conn = self._connect()
+        try:
+            with conn:
+                cursor = conn.execute(
+                    f'DELETE FROM saved_searches WHERE id = ({SAVED_SEARCH_AT_INDEX_SQL})',
+                    (index,)
+                )
+            return cursor.rowcount > 0
+        except sqlite3.Error as e:
+            print(f"Error deleting saved search: {e}")
+            return False
         
     def update_saved_search(self, index: int, search_data: Dict) -> bool:
         """Update an existing saved search"""
-        searches = self.load_saved_searches()
+        if index < 0:
+            return False
         
-        if 0 <= index < len(searches):
-            search_data['updated_at'] = datetime.now().isoformat()
-            searches[index] = search_data
-            self.save_searches(searches)
-            return True
+        search_data['updated_at'] = datetime.now().isoformat()
         
-        return False
+        conn = self._connect()
+        try:
+            with conn:
+                cursor = conn.execute(
+                    f'UPDATE saved_searches SET data = ? WHERE id = ({SAVED_SEARCH_AT_INDEX_SQL})',
+                    (_dumps(search_data), index)
+                )
+            return cursor.rowcount > 0
+        except sqlite3.Error as e:
+            print(f"Error updating saved search: {e}")
+            return False
         
     def save_price_history(self, items: List[Dict]):
-        """Save price history for items to database"""
-        conn = sqlite3.connect(self.db_file)
-        cursor = conn.cursor()
+        """Queue price history for items to be written to the database"""
+        rows = [
+            (
+                item.get('id', ''),
+                item.get('title', ''),
+                item.get('price', 0),
+                item.get('url', ''),
+                item.get('category', ''),
+                item.get('location', ''),
+                item.get('condition', '')
+            )
+            for item in items
+        ]
         
-        for item in items:
+        self._start_history_writer()
+        self._history_queue.put(rows)
+        
+    def _start_history_writer(self):
+        """Start the price history writer thread on first use"""
+        if self._history_writer is not None:
+            return
+        with self._history_writer_lock:
+            if self._history_writer is None:
+                writer = threading.Thread(
+                    target=self._drain_price_history,
+                    name='price-history-writer',
+                    daemon=True
+                )
+                writer.start()
+                self._history_writer = writer
+                
+    def _drain_price_history(self):
+        """Writer thread: commit queued price history in large batches"""
+        while True:
+            item = self._history_queue.get()
+            taken = 1
+            rows = []
+            deadline = time.monotonic() + PRICE_HISTORY_FLUSH_INTERVAL
+            
+            # Keep collecting until the batch is full, the interval has
+            # passed, or a flush/stop marker arrives
+            while item is not _FLUSH and item is not _STOP:
+                rows.extend(item)
+                timeout = deadline - time.monotonic()
+                if len(rows) >= PRICE_HISTORY_FLUSH_ROWS or timeout <= 0:
+                    break
+                try:
+                    item = self._history_queue.get(timeout=timeout)
+                except queue.Empty:
+                    break
+                taken += 1
+            
             try:
-                cursor.execute('''
-                    INSERT INTO price_history 
-                    (finn_id, title, price, url, category, location, condition)
-                    VALUES (?, ?, ?, ?, ?, ?, ?)
-                ''', (
-                    item.get('id', ''),
-                    item.get('title', ''),
-                    item.get('price', 0),
-                    item.get('url', ''),
-                    item.get('category', ''),
-                    item.get('location', ''),
-                    item.get('condition', '')
-                ))
-            except sqlite3.Error as e:
-                print(f"Error saving price history for {item.get('id')}: {e}")
+                if rows:
+                    self._write_price_history_rows(rows)
+            except Exception as e:
+                # Keep the writer alive so flush() and close() never wait on
+                # a thread that has died
+                print(f"Error writing price history batch: {e}")
+            finally:
+                for _ in range(taken):
+                    self._history_queue.task_done()
+            
+            if item is _STOP:
+                return
+                
+    def _write_price_history_rows(self, rows: List[tuple]):
+        """Insert price history rows in a single transaction"""
+        conn = self._connect()
         
-        conn.commit()
-        conn.close()
+        try:
+            # Full chunks go through the multi-row statement, leftovers
+            # through the single-row one
+            full = len(rows) - len(rows) % PRICE_HISTORY_BATCH_ROWS
+            with conn:
+                for start in range(0, full, PRICE_HISTORY_BATCH_ROWS):
+                    chunk = rows[start:start + PRICE_HISTORY_BATCH_ROWS]
+                    conn.execute(
+                        INSERT_PRICE_HISTORY_BATCH_SQL,
+                        [value for row in chunk for value in row]
+                    )
+                conn.executemany(INSERT_PRICE_HISTORY_SQL, rows[full:])
+        except sqlite3.Error as e:
+            print(f"Error saving price history: {e}")
         
     def get_price_history(self, finn_id: str) -> List[Dict]:
         """Get price history for a specific item"""
-        conn = sqlite3.connect(self.db_file)
+        self.flush()
+        conn = self._connect()
         cursor = conn.cursor()
+        cursor.row_factory = PRICE_HISTORY_ROW
         
         cursor.execute('''
             SELECT price, timestamp, title, location, condition
@@ -198,92 +624,122 @@ class DataManager:
             ORDER BY timestamp DESC
         ''', (finn_id,))
         
-        rows = cursor.fetchall()
-        conn.close()
-        
-        return [
-            {
-                'price': row[0],
-                'timestamp': row[1],
-                'title': row[2],
-                'location': row[3],
-                'condition': row[4]
-            }
-            for row in rows
-        ]
+        return cursor.fetchall()
+        
+    def get_price_history_columns(self, finn_id: str) -> Dict[str, Any]:
+        """
+        Get price history for an item as columns, oldest first
+        
+        Prices are returned as a compact array('q') ready for charting or
+        arithmetic; rows without a price are skipped so columns stay aligned.
+        
+        Args:
+            finn_id: Listing ID
+            
+        Returns:
+            Dict with 'price', 'timestamp', 'title', 'location' and 'condition'
+        """
+        self.flush()
+        conn = self._connect()
+        cursor = conn.cursor()
+        cursor.arraysize = 1000
+        
+        cursor.execute('''
+            SELECT CAST(price AS INTEGER), timestamp, title, location, condition
+            FROM price_history
+            WHERE finn_id = ? AND price IS NOT NULL
+            ORDER BY timestamp
+        ''', (finn_id,))
+        
+        prices = array('q')
+        timestamps, titles, locations, conditions = [], [], [], []
+        
+        while rows := cursor.fetchmany():
+            price_col, timestamp_col, title_col, location_col, condition_col = zip(*rows)
+            prices.extend(price_col)
+            timestamps.extend(timestamp_col)
+            titles.extend(title_col)
+            locations.extend(location_col)
+            conditions.extend(condition_col)
+        
+        return {
+            'price': prices,
+            'timestamp': timestamps,
+            'title': titles,
+            'location': locations,
+            'condition': conditions
+        }
         
     def get_price_trends(self, category: str = None, days: int = 30) -> Dict:
         """Get price trends for a category over time"""
-        conn = sqlite3.connect(self.db_file)
+        self.flush()
+        conn = self._connect()
         cursor = conn.cursor()
         
         if category:
             cursor.execute('''
-                SELECT DATE(timestamp) as date, AVG(price) as avg_price, 
-                       COUNT(*) as count, MIN(price) as min_price, MAX(price) as max_price
-                FROM price_history
+                SELECT day, CAST(price_sum AS REAL) / price_count as avg_price, 
+                       row_count as count, min_price, max_price
+                FROM price_daily
                 WHERE category = ? 
-                AND timestamp >= date('now', ?)
-                GROUP BY DATE(timestamp)
-                ORDER BY date
-            ''', (category, f'-{days} days'))
+                AND day >= ?
+                ORDER BY day
+            ''', (category, _cutoff_date(days)))
         else:
             cursor.execute('''
-                SELECT DATE(timestamp) as date, AVG(price) as avg_price,
-                       COUNT(*) as count, MIN(price) as min_price, MAX(price) as max_price
-                FROM price_history
-                WHERE timestamp >= date('now', ?)
-                GROUP BY DATE(timestamp)
-                ORDER BY date
-            ''', (f'-{days} days',))
+                SELECT day, CAST(SUM(price_sum) AS REAL) / SUM(price_count) as avg_price,
+                       SUM(row_count) as count, MIN(min_price) as min_price, MAX(max_price) as max_price
+                FROM price_daily
+                WHERE day >= ?
+                GROUP BY day
+                ORDER BY day
+            ''', (_cutoff_date(days),))
         
         rows = cursor.fetchall()
-        conn.close()
         
-        return {
-            'dates': [row[0] for row in rows],
-            'avg_prices': [row[1] for row in rows],
-            'counts': [row[2] for row in rows],
-            'min_prices': [row[3] for row in rows],
-            'max_prices': [row[4] for row in rows]
-        }
+        # Transpose the rows into columns in one pass
+        columns = [list(column) for column in zip(*rows)] or [[], [], [], [], []]
+        
+        return dict(zip(('dates', 'avg_prices', 'counts', 'min_prices', 'max_prices'), columns))
+        
+    @staticmethod
+    def _saved_item_row(item: Dict) -> tuple:
+        """Build the saved_items parameter tuple for an item"""
+        return (
+            item.get('id', ''),
+            item.get('title', ''),
+            item.get('price', 0),
+            item.get('url', ''),
+            item.get('category', ''),
+            item.get('location', ''),
+            item.get('condition', ''),
+            item.get('deal_score', 0),
+            item.get('notes', '')
+        )
         
     def save_item(self, item: Dict) -> bool:
         """Save/bookmark an item for tracking"""
-        conn = sqlite3.connect(self.db_file)
-        cursor = conn.cursor()
+        return self.save_items([item])
+        
+    def save_items(self, items: List[Dict]) -> bool:
+        """Save/bookmark several items in a single transaction"""
+        conn = self._connect()
         
         try:
-            cursor.execute('''
-                INSERT OR REPLACE INTO saved_items
-                (finn_id, title, price, url, category, location, condition, deal_score, notes)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (
-                item.get('id', ''),
-                item.get('title', ''),
-                item.get('price', 0),
-                item.get('url', ''),
-                item.get('category', ''),
-                item.get('location', ''),
-                item.get('condition', ''),
-                item.get('deal_score', 0),
-                item.get('notes', '')
-            ))
-            
-            conn.commit()
+            with conn:
+                conn.executemany(INSERT_SAVED_ITEM_SQL, map(self._saved_item_row, items))
             success = True
         except sqlite3.Error as e:
             print(f"Error saving item: {e}")
             success = False
-        finally:
-            conn.close()
         
         return success
         
     def get_saved_items(self) -> List[Dict]:
         """Get all saved/bookmarked items"""
-        conn = sqlite3.connect(self.db_file)
+        conn = self._connect()
         cursor = conn.cursor()
+        cursor.row_factory = SAVED_ITEM_ROW
         
         cursor.execute('''
             SELECT finn_id, title, price, url, category, location, 
@@ -292,94 +748,81 @@ class DataManager:
             ORDER BY saved_at DESC
         ''')
         
-        rows = cursor.fetchall()
-        conn.close()
-        
-        return [
-            {
-                'id': row[0],
-                'title': row[1],
-                'price': row[2],
-                'url': row[3],
-                'category': row[4],
-                'location': row[5],
-                'condition': row[6],
-                'deal_score': row[7],
-                'notes': row[8],
-                'saved_at': row[9],
-                'last_updated': row[10]
-            }
-            for row in rows
-        ]
+        return cursor.fetchall()
         
     def delete_saved_item(self, finn_id: str) -> bool:
         """Delete a saved item"""
-        conn = sqlite3.connect(self.db_file)
+        conn = self._connect()
         cursor = conn.cursor()
         
         try:
-            cursor.execute('DELETE FROM saved_items WHERE finn_id = ?', (finn_id,))
+            cursor.execute(DELETE_SAVED_ITEM_SQL, (finn_id,))
             conn.commit()
             success = cursor.rowcount > 0
         except sqlite3.Error as e:
+            conn.rollback()
             print(f"Error deleting item: {e}")
             success = False
-        finally:
-            conn.close()
         
         return success
         
     def save_search_results(self, name: str, params: Dict, results: List[Dict]) -> bool:
         """Save search results for later reference"""
-        conn = sqlite3.connect(self.db_file)
+        conn = self._connect()
         cursor = conn.cursor()
         
         try:
-            cursor.execute('''
-                INSERT INTO search_results (search_name, search_params, results_json)
-                VALUES (?, ?, ?)
-            ''', (
+            cursor.execute(INSERT_SEARCH_RESULTS_SQL, (
                 name,
-                json.dumps(params, ensure_ascii=False),
-                json.dumps(results, ensure_ascii=False)
+                _dumps(params),
+                _pack_results(results)
             ))
             
             conn.commit()
             success = True
         except sqlite3.Error as e:
+            conn.rollback()
             print(f"Error saving search results: {e}")
             success = False
-        finally:
-            conn.close()
         
         return success
         
-    def get_search_results(self, limit: int = 10) -> List[Dict]:
-        """Get recent search results"""
-        conn = sqlite3.connect(self.db_file)
+    def get_search_results(self, limit: int = 10, load_results: bool = True) -> List[Dict]:
+        """
+        Get recent search results
+        
+        Args:
+            limit: Maximum number of saved result sets to return
+            load_results: Whether to fetch and decode the stored listings.
+                When False the 'results' key is omitted and the results
+                column is never read, which keeps history views cheap.
+        """
+        conn = self._connect()
         cursor = conn.cursor()
         
-        cursor.execute('''
-            SELECT id, search_name, search_params, results_json, created_at
+        results_column = 'results_json' if load_results else 'NULL'
+        cursor.execute(f'''
+            SELECT id, search_name, search_params, {results_column} AS results_json, created_at
             FROM search_results
             ORDER BY created_at DESC
             LIMIT ?
         ''', (limit,))
         
         rows = cursor.fetchall()
-        conn.close()
         
         results = []
         for row in rows:
             try:
-                results.append({
-                    'id': row[0],
-                    'name': row[1],
-                    'params': json.loads(row[2]),
-                    'results': json.loads(row[3]),
-                    'created_at': row[4]
-                })
-            except json.JSONDecodeError:
+                entry = {
+                    'id': row['id'],
+                    'name': row['search_name'],
+                    'params': _loads(row['search_params']),
+                    'created_at': row['created_at']
+                }
+                if load_results:
+                    entry['results'] = _unpack_results(row['results_json'])
+                results.append(entry)
+            except (json.JSONDecodeError, zlib.error):
                 continue
         
         return results
@@ -390,81 +833,99 @@ class DataManager:
             return self._get_default_settings()
         
         try:
-            with open(self.settings_file, 'r', encoding='utf-8') as f:
-                settings = json.load(f)
+            with open(self.settings_file, 'rb') as f:
+                settings = _loads(f.read())
                 # Merge with defaults for any missing keys
-                return {**self._get_default_settings(), **settings}
+                return {**DEFAULT_SETTINGS, **settings}
         except (json.JSONDecodeError, IOError):
             return self._get_default_settings()
             
     def save_settings(self, settings: Dict):
         """Save application settings"""
+        data = _dumps_indented(settings)
+        
+        # Settings are saved on every preference change; skip the
+        # write/fsync/rename entirely when nothing actually changed
+        if data == self._settings_written and self.settings_file.exists():
+            return
+        
+        # Write to a temporary file and rename it over the target so a crash
+        # mid-write never leaves a truncated settings file behind
+        tmp_path = self.settings_file.with_suffix('.json.tmp')
         try:
-            with open(self.settings_file, 'w', encoding='utf-8') as f:
-                json.dump(settings, f, indent=2, ensure_ascii=False)
+            with open(tmp_path, 'wb') as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.settings_file)
+            self._settings_written = data
         except IOError as e:
             print(f"Error saving settings: {e}")
             raise
             
     def _get_default_settings(self) -> Dict:
         """Get default application settings"""
-        return {
-            'theme': 'dark',
-            'language': 'no',
-            'max_concurrent_requests': 5,
-            'request_delay_min': 0.5,
-            'request_delay_max': 1.5,
-            'default_max_results': 50,
-            'default_deal_threshold': 70,
-            'auto_save_results': True,
-            'notifications_enabled': False,
-            'proxy_enabled': False,
-            'proxy_url': '',
-            'export_directory': str(Path.home() / 'Downloads'),
-        }
+        return dict(DEFAULT_SETTINGS)
         
     def cleanup_old_data(self, days: int = 90):
         """Clean up old price history data"""
-        conn = sqlite3.connect(self.db_file)
-        cursor = conn.cursor()
+        self.flush()
+        conn = self._connect()
+        cutoff = _cutoff_date(days)
         
         try:
-            cursor.execute('''
-                DELETE FROM price_history
-                WHERE timestamp < date('now', ?)
-            ''', (f'-{days} days',))
+            # Explicit BEGIN keeps the index drops and rebuilds in the same
+            # transaction as the delete
+            with conn:
+                conn.execute('BEGIN')
+                stale_count = conn.execute(
+                    "SELECT COUNT(*) FROM price_history WHERE timestamp < ?",
+                    (cutoff,)
+                ).fetchone()[0]
+                total_count = conn.execute('SELECT COUNT(*) FROM price_history').fetchone()[0]
+                
+                rebuild_indexes = (
+                    stale_count >= CLEANUP_REBUILD_MIN_ROWS
+                    and stale_count > total_count * CLEANUP_REBUILD_RATIO
+                )
+                if rebuild_indexes:
+                    for name in PRICE_HISTORY_INDEXES:
+                        conn.execute(f'DROP INDEX IF EXISTS {name}')
+                
+                cursor = conn.execute('''
+                    DELETE FROM price_history
+                    WHERE timestamp < ?
+                ''', (cutoff,))
+                
+                if rebuild_indexes:
+                    for create_sql in PRICE_HISTORY_INDEXES.values():
+                        conn.execute(create_sql)
+                
+                conn.execute('DELETE FROM price_daily WHERE day < ?', (cutoff,))
             
             deleted_count = cursor.rowcount
-            conn.commit()
             print(f"Cleaned up {deleted_count} old price history records")
         except sqlite3.Error as e:
             print(f"Error during cleanup: {e}")
-        finally:
-            conn.close()
             
     def get_statistics(self) -> Dict:
         """Get database statistics"""
-        conn = sqlite3.connect(self.db_file)
+        self.flush()
+        conn = self._connect()
         cursor = conn.cursor()
         
         stats = {}
         
         try:
-            cursor.execute('SELECT COUNT(*) FROM price_history')
-            stats['price_history_count'] = cursor.fetchone()[0]
-            
-            cursor.execute('SELECT COUNT(*) FROM saved_items')
-            stats['saved_items_count'] = cursor.fetchone()[0]
-            
-            cursor.execute('SELECT COUNT(*) FROM search_results')
-            stats['search_results_count'] = cursor.fetchone()[0]
-            
-            cursor.execute('SELECT COUNT(DISTINCT finn_id) FROM price_history')
-            stats['unique_items_tracked'] = cursor.fetchone()[0]
+            cursor.execute(STATISTICS_SQL)
+            (
+                stats['price_history_count'],
+                stats['saved_items_count'],
+                stats['search_results_count'],
+                stats['unique_items_tracked']
+            ) = cursor.fetchone()
             
         except sqlite3.Error as e:
             print(f"Error getting statistics: {e}")
-        finally:
-            conn.close()
         
         return stats
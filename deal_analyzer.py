@@ -4,30 +4,91 @@ Deal Analyzer Module
 Analyzes scraped items to identify deals and calculate deal scores
 """
 
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterator, Optional
+import heapq
+import math
 import re
+from bisect import bisect_right
 from collections import defaultdict
-import statistics
+from functools import lru_cache
+from itertools import islice
+
+
+# Listing age keywords by bucket, in priority order, and the age factor
+# each bucket scores
+POSTED_AGE_RE = re.compile(
+    r'(?P<today>i dag|today|time|minut)'
+    r'|(?P<yesterday>i går|yesterday)'
+    r'|(?P<weeks>uke|week)'
+    r'|(?P<months>måned|month)'
+)
+POSTED_AGE_PRIORITY = {'today': 0, 'yesterday': 1, 'weeks': 2, 'months': 3}
+POSTED_AGE_FACTORS = {
+    'today': 90,      # Very new listing - might be a fresh deal
+    'yesterday': 85,
+    'weeks': 55,      # Weeks old - might be overpriced
+    'months': 40,     # Old listing
+}
+
+# A standalone day count of 1-7 followed by "dag"/"dager", e.g. "3 dager siden"
+POSTED_DAYS_RE = re.compile(r'\b([1-7])\b.*dag')
+
+# Whole words long enough to be significant: 3+ characters for group keys,
+# 4+ for comparison groups
+GROUP_WORD_RE = re.compile(r'\b\w{3,}\b')
+COMPARISON_WORD_RE = re.compile(r'\b\w{4,}\b')
+
+# Deal score bands: scores below 50 are 'poor', 50-69 'fair', and so on
+SCORE_BAND_EDGES = (50, 70, 80, 90)
+SCORE_BANDS = ('poor', 'fair', 'good', 'great', 'excellent')
+
+
+def _sorted_median(values: List[float]) -> float:
+    """Median of an already sorted, non-empty list"""
+    mid = len(values) // 2
+    if len(values) % 2:
+        return values[mid]
+    return (values[mid - 1] + values[mid]) / 2
 
 
 class DealAnalyzer:
     """Analyzes items to identify deals and calculate scores"""
     
-    # Known brands and their typical price ranges (for reference)
-    BRAND_PATTERNS = {
-        'apple': r'\b(iphone|ipad|macbook|mac|apple|airpods|watch)\b',
-        'samsung': r'\b(samsung|galaxy)\b',
-        'sony': r'\b(sony|playstation|ps[45])\b',
-        'microsoft': r'\b(xbox|microsoft|surface)\b',
-        'nintendo': r'\b(nintendo|switch)\b',
-        'dyson': r'\b(dyson)\b',
-        'lg': r'\b(lg|oled)\b',
-        'dji': r'\b(dji|mavic|mini|phantom)\b',
-        'canon': r'\b(canon|eos)\b',
-        'nikon': r'\b(nikon)\b',
-        'nvidia': r'\b(nvidia|geforce|rtx|gtx)\b',
-        'amd': r'\b(amd|ryzen|radeon)\b',
-    }
+    # Known brands and their typical price ranges (for reference),
+    # compiled once as (brand, regex) pairs in priority order
+    BRAND_PATTERNS = tuple(
+        (brand, re.compile(pattern, re.IGNORECASE))
+        for brand, pattern in {
+            'apple': r'\b(iphone|ipad|macbook|mac|apple|airpods|watch)\b',
+            'samsung': r'\b(samsung|galaxy)\b',
+            'sony': r'\b(sony|playstation|ps[45])\b',
+            'microsoft': r'\b(xbox|microsoft|surface)\b',
+            'nintendo': r'\b(nintendo|switch)\b',
+            'dyson': r'\b(dyson)\b',
+            'lg': r'\b(lg|oled)\b',
+            'dji': r'\b(dji|mavic|mini|phantom)\b',
+            'canon': r'\b(canon|eos)\b',
+            'nikon': r'\b(nikon)\b',
+            'nvidia': r'\b(nvidia|geforce|rtx|gtx)\b',
+            'amd': r'\b(amd|ryzen|radeon)\b',
+        }.items()
+    )
+    
+    # All brand patterns fused into one alternation so a title is scanned
+    # once. Brand keywords are disjoint whole words, so every brand mention
+    # is its own match and the highest-priority brand can be picked from them.
+    BRAND_REGEX = re.compile(
+        '|'.join(f'(?P<{brand}>{pattern.pattern})' for brand, pattern in BRAND_PATTERNS),
+        re.IGNORECASE
+    )
+    BRAND_PRIORITY = {brand: rank for rank, (brand, _) in enumerate(BRAND_PATTERNS)}
+    
+    # Common words ignored when building group keys
+    STOP_WORDS = frozenset({
+        'til', 'for', 'med', 'og', 'i', 'på', 'selges', 'salg',
+        'pent', 'brukt', 'ny', 'som', 'god', 'fin', 'veldig',
+        'the', 'a', 'an', 'sale', 'selling'
+    })
     
     # Condition weights for deal scoring
     CONDITION_WEIGHTS = {
@@ -43,6 +104,37 @@ class DealAnalyzer:
         'for repair': 0.40,
     }
     
+    # Same weights as a tuple for the per-item substring scan
+    CONDITION_ITEMS = tuple(CONDITION_WEIGHTS.items())
+    
+    # Recommendation text and level per score band (see SCORE_BAND_EDGES)
+    RECOMMENDATIONS = (
+        ('⚠️ Above Average Price', 'overpriced'),
+        ('📊 Fair Price - Compare Before Buying', 'fair'),
+        ('👍 Good Deal - Worth Considering', 'good'),
+        ('⭐ Great Deal - Highly Recommended', 'great'),
+        ('🔥 EXCELLENT DEAL - Buy Now!', 'excellent'),
+    )
+    
+    # Factors for items without a price. Shared by every such item, so it
+    # must be treated as read-only.
+    NO_PRICE_FACTORS = {
+        'price_factor': 0,
+        'condition_factor': 0,
+        'seller_factor': 0,
+        'listing_age_factor': 0,
+        'details': {}
+    }
+    
+    # Short verdict per score band used by get_deal_summary
+    SUMMARY_VERDICTS = (
+        '⚠️ Above Average',
+        '📊 Fair Price',
+        '👍 Good Deal',
+        '⭐ Great Deal',
+        '🔥 EXCELLENT DEAL!',
+    )
+    
     def __init__(self):
         self.price_history = defaultdict(list)
         
@@ -68,69 +160,17 @@ class DealAnalyzer:
                 'comparisons': {}
             }
         
-        # Group similar items to calculate average prices
-        price_groups = self._group_by_similarity(items)
-        
-        # Calculate average prices for each group
-        group_averages = {}
-        for group_key, group_items in price_groups.items():
-            prices = [item.get('price', 0) for item in group_items if item.get('price', 0) > 0]
-            if prices:
-                group_averages[group_key] = {
-                    'avg': statistics.mean(prices),
-                    'median': statistics.median(prices),
-                    'min': min(prices),
-                    'max': max(prices),
-                    'count': len(prices)
-                }
+        # Work on parallel columns: one lowercased title and group key per item
+        titles = [item.get('title', '').lower() for item in items]
+        group_keys = [self._get_group_key(item, title) for item, title in zip(items, titles)]
         
-        # Calculate deal score for each item
-        analyzed_items = []
-        for item in items:
-            analyzed_item = item.copy()
-            
-            # Find the group this item belongs to
-            group_key = self._get_group_key(item)
-            group_stats = group_averages.get(group_key, {})
-            
-            # Calculate deal score
-            deal_score, factors = self._calculate_deal_score(item, group_stats)
-            
-            analyzed_item['deal_score'] = deal_score
-            analyzed_item['deal_factors'] = factors
-            analyzed_item['avg_price'] = group_stats.get('avg', 0)
-            analyzed_item['price_comparison'] = {
-                'group_avg': group_stats.get('avg', 0),
-                'group_median': group_stats.get('median', 0),
-                'group_min': group_stats.get('min', 0),
-                'group_max': group_stats.get('max', 0),
-                'similar_items_count': group_stats.get('count', 0)
-            }
-            
-            # Add deal recommendation
-            if deal_score >= 90:
-                analyzed_item['recommendation'] = '🔥 EXCELLENT DEAL - Buy Now!'
-                analyzed_item['recommendation_level'] = 'excellent'
-            elif deal_score >= 80:
-                analyzed_item['recommendation'] = '⭐ Great Deal - Highly Recommended'
-                analyzed_item['recommendation_level'] = 'great'
-            elif deal_score >= 70:
-                analyzed_item['recommendation'] = '👍 Good Deal - Worth Considering'
-                analyzed_item['recommendation_level'] = 'good'
-            elif deal_score >= 50:
-                analyzed_item['recommendation'] = '📊 Fair Price - Compare Before Buying'
-                analyzed_item['recommendation_level'] = 'fair'
-            else:
-                analyzed_item['recommendation'] = '⚠️ Above Average Price'
-                analyzed_item['recommendation_level'] = 'overpriced'
-            
-            analyzed_items.append(analyzed_item)
+        analyzed_items = list(self._iter_analyzed(items, group_keys))
         
         # Calculate overall statistics
         stats = self._calculate_overall_stats(analyzed_items, threshold)
         
         # Find comparison groups
-        comparisons = self._find_comparison_groups(analyzed_items)
+        comparisons = self._find_comparison_groups(analyzed_items, titles)
         
         return {
             'items': analyzed_items,
@@ -138,39 +178,118 @@ class DealAnalyzer:
             'comparisons': comparisons
         }
         
-    def _group_by_similarity(self, items: List[Dict]) -> Dict[str, List[Dict]]:
-        """Group items by similarity for price comparison"""
-        groups = defaultdict(list)
+    def iter_analyzed(self, items: List[Dict]) -> Iterator[Dict]:
+        """
+        Yield analyzed items one at a time
         
-        for item in items:
-            key = self._get_group_key(item)
-            groups[key].append(item)
+        Group prices still need one pass over all items up front, but the
+        enriched item dicts are produced lazily, so callers that stream
+        results never hold the whole analyzed list. Overall statistics and
+        comparison groups are only available from analyze().
+        
+        Args:
+            items: Sequence of scraped items (iterated twice)
+            
+        Yields:
+            Analyzed items in input order, as returned by analyze()
+        """
+        group_keys = [self._get_group_key(item) for item in items]
+        yield from self._iter_analyzed(items, group_keys)
+        
+    def _iter_analyzed(self, items: List[Dict], group_keys: List[str]) -> Iterator[Dict]:
+        """Score items against their group's prices, yielding analyzed items"""
+        # Collect the positive prices per group, reading each item once
+        group_prices = defaultdict(list)
+        for group_key, item in zip(group_keys, items):
+            price = item.get('price', 0)
+            if price > 0:
+                group_prices[group_key].append(price)
+        
+        # Calculate average prices for each group, plus the comparison block
+        # every item in the group shares
+        group_averages = {}
+        group_comparisons = {}
+        for group_key, prices in group_prices.items():
+            prices.sort()
+            averages = group_averages[group_key] = {
+                'avg': math.fsum(prices) / len(prices),
+                'median': _sorted_median(prices),
+                'min': prices[0],
+                'max': prices[-1],
+                'count': len(prices)
+            }
+            group_comparisons[group_key] = {
+                'group_avg': averages['avg'],
+                'group_median': averages['median'],
+                'group_min': averages['min'],
+                'group_max': averages['max'],
+                'similar_items_count': averages['count']
+            }
+        
+        empty_stats = {}
+        empty_comparison = {
+            'group_avg': 0,
+            'group_median': 0,
+            'group_min': 0,
+            'group_max': 0,
+            'similar_items_count': 0
+        }
+        
+        # Calculate deal score for each item
+        for item, group_key in zip(items, group_keys):
+            # Find the group this item belongs to
+            group_stats = group_averages.get(group_key, empty_stats)
+            
+            # Calculate deal score
+            deal_score, factors = self._calculate_deal_score(item, group_stats)
+            
+            # Add deal recommendation
+            recommendation, level = self.RECOMMENDATIONS[bisect_right(SCORE_BAND_EDGES, deal_score)]
+            
+            # Build the analyzed item in one step rather than copying the
+            # scraped dict and growing it key by key
+            yield {
+                **item,
+                'deal_score': deal_score,
+                'deal_factors': factors,
+                'avg_price': group_stats.get('avg', 0),
+                'price_comparison': dict(group_comparisons.get(group_key, empty_comparison)),
+                'recommendation': recommendation,
+                'recommendation_level': level
+            }
+            
+    def _get_group_key(self, item: Dict, title: Optional[str] = None) -> str:
+        """Generate a grouping key for an item, optionally from its pre-lowercased title"""
+        if title is None:
+            title = item.get('title', '').lower()
         
-        return dict(groups)
+        if not title:
+            return 'unknown'
         
-    def _get_group_key(self, item: Dict) -> str:
-        """Generate a grouping key for an item"""
-        title = item.get('title', '').lower()
+        return self._group_key_for_title(title)
         
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _group_key_for_title(title: str) -> str:
+        """
+        Build the grouping key for a lowercased title
+        
+        Reposted and near-identical listings share titles, so keys are
+        memoized per title and the regex work runs once for each.
+        """
         # Extract brand
-        brand = 'unknown'
-        for brand_name, pattern in self.BRAND_PATTERNS.items():
-            if re.search(pattern, title, re.IGNORECASE):
-                brand = brand_name
-                break
+        brand = min(
+            (match.lastgroup for match in DealAnalyzer.BRAND_REGEX.finditer(title)),
+            key=DealAnalyzer.BRAND_PRIORITY.__getitem__,
+            default='unknown'
+        )
         
         # Extract product type/model keywords
         # Remove common words and keep significant terms
-        words = re.findall(r'\b[\w]+\b', title)
-        significant_words = []
-        
-        stop_words = {'til', 'for', 'med', 'og', 'i', 'på', 'selges', 'salg', 
-                     'pent', 'brukt', 'ny', 'som', 'god', 'fin', 'veldig',
-                     'the', 'a', 'an', 'for', 'sale', 'selling'}
-        
-        for word in words:
-            if word not in stop_words and len(word) > 2:
-                significant_words.append(word)
+        significant_words = [
+            word for word in GROUP_WORD_RE.findall(title)
+            if word not in DealAnalyzer.STOP_WORDS
+        ]
         
         # Create key from brand + first 2 significant words
         key_parts = [brand]
@@ -178,6 +297,20 @@ class DealAnalyzer:
         
         return '_'.join(key_parts)
         
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _condition_weight(condition: str) -> float:
+        """
+        Weight for a normalized condition string
+        
+        Listings use a small vocabulary of conditions, so the substring scan
+        runs once per distinct value and later lookups are a cache hit.
+        """
+        for cond_key, weight in DealAnalyzer.CONDITION_ITEMS:
+            if cond_key in condition:
+                return weight
+        return 0.7  # Default
+        
     def _calculate_deal_score(
         self,
         item: Dict,
@@ -189,6 +322,11 @@ class DealAnalyzer:
         Returns:
             tuple of (score, factors_dict)
         """
+        price = item.get('price', 0)
+        
+        if price <= 0:
+            return 0, self.NO_PRICE_FACTORS
+        
         factors = {
             'price_factor': 0,
             'condition_factor': 0,
@@ -197,11 +335,6 @@ class DealAnalyzer:
             'details': {}
         }
         
-        price = item.get('price', 0)
-        
-        if price <= 0:
-            return 0, factors
-        
         # 1. Price Factor (60% of score)
         # Compare to group average
         avg_price = group_stats.get('avg', 0)
@@ -226,12 +359,7 @@ class DealAnalyzer:
         
         # 2. Condition Factor (20% of score)
         condition = item.get('condition', '').lower().strip()
-        condition_weight = 0.7  # Default
-        
-        for cond_key, weight in self.CONDITION_WEIGHTS.items():
-            if cond_key in condition:
-                condition_weight = weight
-                break
+        condition_weight = self._condition_weight(condition)
         
         condition_factor = condition_weight * 100
         factors['condition_factor'] = condition_factor
@@ -255,18 +383,21 @@ class DealAnalyzer:
         posted = item.get('posted', '').lower()
         listing_age_factor = 70  # Default
         
-        if 'i dag' in posted or 'today' in posted or 'time' in posted or 'minut' in posted:
-            listing_age_factor = 90  # Very new listing - might be a fresh deal
-        elif 'i går' in posted or 'yesterday' in posted:
-            listing_age_factor = 85
-        elif any(str(i) in posted for i in range(1, 4)) and 'dag' in posted:
+        # One scan finds every age keyword; the most recent bucket wins
+        age_bucket = min(
+            (match.lastgroup for match in POSTED_AGE_RE.finditer(posted)),
+            key=POSTED_AGE_PRIORITY.__getitem__,
+            default=None
+        )
+        
+        if age_bucket in ('today', 'yesterday'):
+            listing_age_factor = POSTED_AGE_FACTORS[age_bucket]
+        elif (days_match := POSTED_DAYS_RE.search(posted)) and days_match.group(1) <= '3':
             listing_age_factor = 75  # Few days old
-        elif any(str(i) in posted for i in range(4, 8)) and 'dag' in posted:
+        elif days_match:
             listing_age_factor = 65  # About a week
-        elif 'uke' in posted or 'week' in posted:
-            listing_age_factor = 55  # Weeks old - might be overpriced
-        elif 'måned' in posted or 'month' in posted:
-            listing_age_factor = 40  # Old listing
+        elif age_bucket:
+            listing_age_factor = POSTED_AGE_FACTORS[age_bucket]
         
         factors['listing_age_factor'] = listing_age_factor
         factors['details']['posted'] = posted or 'Unknown'
@@ -309,69 +440,65 @@ class DealAnalyzer:
         if not items:
             return stats
         
-        # Price statistics
-        prices = [item.get('price', 0) for item in items if item.get('price', 0) > 0]
-        if prices:
-            stats['avg_price'] = statistics.mean(prices)
-            stats['median_price'] = statistics.median(prices)
-            stats['min_price'] = min(prices)
-            stats['max_price'] = max(prices)
-        
-        # Deal score statistics
-        scores = [item.get('deal_score', 0) for item in items]
-        if scores:
-            stats['avg_deal_score'] = statistics.mean(scores)
-            stats['best_deal_score'] = max(scores)
-        
-        # Count deals by threshold
-        stats['deals_count'] = len([item for item in items if item.get('deal_score', 0) >= threshold])
-        
-        # Calculate potential savings
+        # Gather everything in a single pass over the items
+        prices = []
+        scores = []
+        deals_count = 0
         total_savings = 0
+        distribution = stats['score_distribution']
+        
         for item in items:
+            price = item.get('price', 0)
             score = item.get('deal_score', 0)
+            
+            if price > 0:
+                prices.append(price)
+            scores.append(score)
+            
+            # Count deals by threshold and their potential savings
             if score >= threshold:
+                deals_count += 1
                 avg_price = item.get('avg_price', 0)
-                price = item.get('price', 0)
                 if avg_price > price > 0:
                     total_savings += (avg_price - price)
+            
+            distribution[SCORE_BANDS[bisect_right(SCORE_BAND_EDGES, score)]] += 1
         
-        stats['potential_savings'] = total_savings
+        # Price statistics
+        if prices:
+            # One sort serves median, min and max
+            prices.sort()
+            stats['avg_price'] = math.fsum(prices) / len(prices)
+            stats['median_price'] = _sorted_median(prices)
+            stats['min_price'] = prices[0]
+            stats['max_price'] = prices[-1]
         
-        # Score distribution
-        for item in items:
-            score = item.get('deal_score', 0)
-            if score >= 90:
-                stats['score_distribution']['excellent'] += 1
-            elif score >= 80:
-                stats['score_distribution']['great'] += 1
-            elif score >= 70:
-                stats['score_distribution']['good'] += 1
-            elif score >= 50:
-                stats['score_distribution']['fair'] += 1
-            else:
-                stats['score_distribution']['poor'] += 1
+        # Deal score statistics
+        stats['avg_deal_score'] = math.fsum(scores) / len(scores)
+        stats['best_deal_score'] = max(scores)
+        
+        stats['deals_count'] = deals_count
+        stats['potential_savings'] = total_savings
         
         return stats
         
-    def _find_comparison_groups(self, items: List[Dict]) -> Dict[str, List[Dict]]:
-        """Find groups of similar items for comparison"""
+    def _find_comparison_groups(
+        self,
+        items: List[Dict],
+        titles: Optional[List[str]] = None
+    ) -> Dict[str, List[Dict]]:
+        """Find groups of similar items for comparison, optionally from pre-lowercased titles"""
         comparisons = {}
         
         # Group by similarity
         groups = defaultdict(list)
         
-        for item in items:
-            # Create a normalized title key
-            title = item.get('title', '').lower()
-            
+        if titles is None:
+            titles = [item.get('title', '').lower() for item in items]
+        
+        for item, title in zip(items, titles):
             # Extract key terms
-            words = re.findall(r'\b[\w]+\b', title)
-            significant_words = []
-            
-            for word in words:
-                if len(word) > 3:
-                    significant_words.append(word)
+            significant_words = COMPARISON_WORD_RE.findall(title)
             
             if len(significant_words) >= 2:
                 # Use first 3 significant words as key
@@ -381,13 +508,13 @@ class DealAnalyzer:
         # Keep only groups with 2+ items
         for key, group_items in groups.items():
             if len(group_items) >= 2:
-                # Sort by price and limit
-                sorted_items = sorted(
+                # Cheapest 5 by price, without sorting the whole group
+                display_key = key.title()
+                comparisons[display_key] = heapq.nsmallest(
+                    5,
                     group_items,
                     key=lambda x: x.get('price', float('inf'))
                 )
-                display_key = key.title()
-                comparisons[display_key] = sorted_items[:5]
         
         return comparisons
         
@@ -401,16 +528,7 @@ class DealAnalyzer:
         lines = []
         
         # Overall verdict
-        if score >= 90:
-            lines.append("🔥 EXCELLENT DEAL!")
-        elif score >= 80:
-            lines.append("⭐ Great Deal")
-        elif score >= 70:
-            lines.append("👍 Good Deal")
-        elif score >= 50:
-            lines.append("📊 Fair Price")
-        else:
-            lines.append("⚠️ Above Average")
+        lines.append(self.SUMMARY_VERDICTS[bisect_right(SCORE_BAND_EDGES, score)])
         
         lines.append(f"Deal Score: {score}/100")
         
@@ -442,12 +560,11 @@ def analyze_price_trend(prices: List[float]) -> Dict:
     if len(prices) < 2:
         return {'trend': 'insufficient_data', 'change': 0}
     
-    # Calculate trend
-    first_half = prices[:len(prices)//2]
-    second_half = prices[len(prices)//2:]
-    
-    avg_first = sum(first_half) / len(first_half) if first_half else 0
-    avg_second = sum(second_half) / len(second_half) if second_half else 0
+    # Calculate trend; both halves are non-empty here, and summing through
+    # islice avoids copying them out of the list
+    half = len(prices) // 2
+    avg_first = sum(islice(prices, half)) / half
+    avg_second = sum(islice(prices, half, None)) / (len(prices) - half)
     
     if avg_first > 0:
         change_pct = ((avg_second - avg_first) / avg_first) * 100
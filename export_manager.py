@@ -8,10 +8,374 @@ import csv
 import json
 import os
 from datetime import datetime
+from itertools import chain, islice
+from bisect import bisect_right
 from typing import List, Dict, Any, Optional
 from pathlib import Path
 import html
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import openpyxl
+    from openpyxl.cell import WriteOnlyCell
+    from openpyxl.styles import Font, PatternFill, Alignment, Border, Side, NamedStyle
+    from openpyxl.utils import get_column_letter
+except ImportError:
+    openpyxl = None
+
+
+if orjson is not None:
+    def _dumps_indented(obj: Any) -> bytes:
+        """Serialize obj to indented UTF-8 JSON for files"""
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+else:
+    def _dumps_indented(obj: Any) -> bytes:
+        """Serialize obj to indented UTF-8 JSON for files"""
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+# Shared formatters for kroner amounts and percentages
+_format_kr = '{:,.0f} kr'.format
+_format_percent = '{:.1f}%'.format
+
+# Buffer size for export files, so large exports go out in few write() calls
+WRITE_BUFFER_SIZE = 1 << 20
+
+
+class CSVExportDialect(csv.Dialect):
+    """Fixed CSV dialect for exports, resolved once instead of per writer"""
+    delimiter = ','
+    quotechar = '"'
+    doublequote = True
+    skipinitialspace = False
+    lineterminator = '\r\n'
+    quoting = csv.QUOTE_MINIMAL
+
+
+# Item fields kept in exports without analysis data
+STRIP_ANALYSIS_KEYS = (
+    'id',
+    'title',
+    'price',
+    'location',
+    'condition',
+    'posted',
+    'url',
+    'seller_type',
+)
+
+# Excel column widths fit the header and the first data rows, capped so long
+# titles and URLs don't make the sheet unreadable
+EXCEL_WIDTH_SAMPLE_ROWS = 98
+EXCEL_MAX_COLUMN_WIDTH = 50
+
+# Excel styles are immutable once built, so every export shares them
+if openpyxl is not None:
+    EXCEL_HEADER_FONT = Font(bold=True, color="FFFFFF")
+    EXCEL_HEADER_FILL = PatternFill(start_color="4F46E5", end_color="4F46E5", fill_type="solid")
+    EXCEL_HEADER_ALIGNMENT = Alignment(horizontal='center')
+    EXCEL_THIN_BORDER = Border(
+        left=Side(style='thin'),
+        right=Side(style='thin'),
+        top=Side(style='thin'),
+        bottom=Side(style='thin')
+    )
+    
+    # Named style and fill for each highlighted data row variant; other
+    # data rows are written unstyled
+    EXCEL_ROW_STYLES = (
+        ('good_deal_row', PatternFill(start_color="DCFCE7", end_color="DCFCE7", fill_type="solid")),
+        ('great_deal_row', PatternFill(start_color="86EFAC", end_color="86EFAC", fill_type="solid")),
+        ('excellent_deal_row', PatternFill(start_color="4ADE80", end_color="4ADE80", fill_type="solid")),
+    )
+
+# Print report stylesheet, kept out of the per-report f-string
+PRINT_REPORT_STYLE = '''<style>
+        * {
+            margin: 0;
+            padding: 0;
+            box-sizing: border-box;
+        }
+        
+        body {
+            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, Oxygen, Ubuntu, sans-serif;
+            line-height: 1.6;
+            color: #1e293b;
+            background: #f8fafc;
+            padding: 20px;
+        }
+        
+        .container {
+            max-width: 1200px;
+            margin: 0 auto;
+            background: white;
+            border-radius: 12px;
+            box-shadow: 0 4px 6px -1px rgba(0, 0, 0, 0.1);
+            overflow: hidden;
+        }
+        
+        .header {
+            background: linear-gradient(135deg, #4f46e5 0%, #7c3aed 100%);
+            color: white;
+            padding: 30px;
+            text-align: center;
+        }
+        
+        .header h1 {
+            font-size: 2rem;
+            margin-bottom: 10px;
+        }
+        
+        .header .subtitle {
+            opacity: 0.9;
+            font-size: 1.1rem;
+        }
+        
+        .search-info {
+            background: rgba(255,255,255,0.1);
+            padding: 10px 20px;
+            border-radius: 8px;
+            margin-top: 15px;
+            display: inline-block;
+        }
+        
+        .stats-grid {
+            display: grid;
+            grid-template-columns: repeat(auto-fit, minmax(150px, 1fr));
+            gap: 15px;
+            padding: 25px;
+            background: #f1f5f9;
+        }
+        
+        .stat-card {
+            background: white;
+            padding: 15px;
+            border-radius: 8px;
+            text-align: center;
+            box-shadow: 0 1px 3px rgba(0,0,0,0.1);
+        }
+        
+        .stat-value {
+            font-size: 1.8rem;
+            font-weight: bold;
+            color: #4f46e5;
+        }
+        
+        .stat-label {
+            font-size: 0.85rem;
+            color: #64748b;
+            margin-top: 5px;
+        }
+        
+        .deals-table {
+            width: 100%;
+            border-collapse: collapse;
+        }
+        
+        .deals-table th {
+            background: #1e293b;
+            color: white;
+            padding: 15px 12px;
+            text-align: left;
+            font-weight: 600;
+            position: sticky;
+            top: 0;
+        }
+        
+        .item-row {
+            border-bottom: 1px solid #e2e8f0;
+            transition: background 0.2s;
+        }
+        
+        .item-row:hover {
+            background: #f8fafc;
+        }
+        
+        .item-row td {
+            padding: 15px 12px;
+            vertical-align: top;
+        }
+        
+        .item-row.excellent {
+            background: linear-gradient(90deg, #dcfce7 0%, white 100%);
+        }
+        
+        .item-row.great {
+            background: linear-gradient(90deg, #fef9c3 0%, white 100%);
+        }
+        
+        .item-row.good {
+            background: linear-gradient(90deg, #e0f2fe 0%, white 100%);
+        }
+        
+        .rank {
+            width: 40px;
+            font-weight: bold;
+            color: #64748b;
+        }
+        
+        .title {
+            max-width: 350px;
+        }
+        
+        .title strong {
+            color: #1e293b;
+        }
+        
+        .location {
+            color: #64748b;
+        }
+        
+        .deal-badge {
+            display: inline-block;
+            padding: 2px 8px;
+            border-radius: 4px;
+            font-size: 0.75rem;
+            font-weight: bold;
+            margin-left: 8px;
+            background: #4f46e5;
+            color: white;
+        }
+        
+        .price {
+            font-size: 1.1rem;
+        }
+        
+        .savings {
+            display: block;
+            color: #059669;
+            font-size: 0.85rem;
+            margin-top: 4px;
+        }
+        
+        .score {
+            width: 120px;
+        }
+        
+        .score-bar {
+            width: 80px;
+            height: 8px;
+            background: #e2e8f0;
+            border-radius: 4px;
+            overflow: hidden;
+            display: inline-block;
+            vertical-align: middle;
+            margin-right: 8px;
+        }
+        
+        .score-fill {
+            height: 100%;
+            border-radius: 4px;
+            transition: width 0.3s;
+        }
+        
+        .score-fill.excellent {
+            background: #22c55e;
+        }
+        
+        .score-fill.great {
+            background: #84cc16;
+        }
+        
+        .score-fill.good {
+            background: #eab308;
+        }
+        
+        .score-fill.normal {
+            background: #94a3b8;
+        }
+        
+        .link a {
+            color: #4f46e5;
+            text-decoration: none;
+            font-weight: 500;
+        }
+        
+        .link a:hover {
+            text-decoration: underline;
+        }
+        
+        .footer {
+            text-align: center;
+            padding: 20px;
+            background: #f1f5f9;
+            color: #64748b;
+            font-size: 0.9rem;
+        }
+        
+        @media print {
+            body {
+                padding: 0;
+                background: white;
+            }
+            
+            .container {
+                box-shadow: none;
+            }
+            
+            .header {
+                background: #4f46e5 !important;
+                -webkit-print-color-adjust: exact;
+                print-color-adjust: exact;
+            }
+            
+            .item-row.excellent,
+            .item-row.great,
+            .item-row.good {
+                -webkit-print-color-adjust: exact;
+                print-color-adjust: exact;
+            }
+            
+            .link {
+                display: none;
+            }
+        }
+    </style>'''
+
+# One row of the print report table, filled in per item
+_PRINT_ROW_TEMPLATE = '''
+                <tr class="item-row {deal_class}">
+                    <td class="rank">{rank}</td>
+                    <td class="title">
+                        <strong>{title}</strong>
+                        {deal_badge}
+                        <br><small class="location">📍 {location}</small>
+                    </td>
+                    <td class="price">
+                        <strong>{price:,.0f} kr</strong>
+                        {savings}
+                    </td>
+                    <td class="score">
+                        <div class="score-bar">
+                            <div class="score-fill {deal_class}" style="width: {deal_score}%"></div>
+                        </div>
+                        <span>{deal_score}%</span>
+                    </td>
+                    <td class="condition">{condition}</td>
+                    <td class="link">
+                        <a href="{url}" target="_blank">View</a>
+                    </td>
+                </tr>
+            '''
+
+# Score thresholds for the good, great and excellent print report rows
+PRINT_DEAL_EDGES = (70, 80, 90)
+
+# Row templates per deal band with the class and badge already filled in
+PRINT_ROW_TEMPLATES = tuple(
+    _PRINT_ROW_TEMPLATE.replace('{deal_class}', deal_class).replace('{deal_badge}', deal_badge)
+    for deal_class, deal_badge in (
+        ('normal', ''),
+        ('good', '<span class="deal-badge">👍 GOOD</span>'),
+        ('great', '<span class="deal-badge">⭐ GREAT</span>'),
+        ('excellent', '<span class="deal-badge">🔥 EXCELLENT</span>'),
+    )
+)
+
 
 class ExportManager:
     """Manages exporting search results to various formats"""
@@ -48,16 +412,18 @@ class ExportManager:
         Returns:
             Path to exported file
         """
+        now = datetime.now()
+        
         if not filename:
-            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+            timestamp = now.strftime('%Y%m%d_%H%M%S')
             filename = f'finn_deals_{timestamp}'
         
         if format_type == 'csv':
             return self._export_csv(items, filename, include_analysis)
         elif format_type == 'excel':
-            return self._export_excel(items, filename, include_analysis)
+            return self._export_excel(items, filename, include_analysis, now)
         elif format_type == 'json':
-            return self._export_json(items, filename, include_analysis)
+            return self._export_json(items, filename, include_analysis, now)
         else:
             raise ValueError(f"Unsupported format: {format_type}")
             
@@ -92,36 +458,38 @@ class ExportManager:
                 'Condition Factor',
             ])
         
-        with open(filepath, 'w', newline='', encoding='utf-8-sig') as f:
-            writer = csv.DictWriter(f, fieldnames=columns)
-            writer.writeheader()
+        def row_of(item: Dict) -> tuple:
+            get = item.get
+            row = (
+                get('title', ''),
+                get('price', ''),
+                get('avg_price', ''),
+                get('deal_score', ''),
+                get('recommendation', ''),
+                get('location', ''),
+                get('condition', ''),
+                get('posted', ''),
+                get('seller_type', ''),
+                get('url', ''),
+                get('id', '')
+            )
             
-            for item in items:
-                row = {
-                    'Title': item.get('title', ''),
-                    'Price (NOK)': item.get('price', ''),
-                    'Average Price (NOK)': item.get('avg_price', ''),
-                    'Deal Score (%)': item.get('deal_score', ''),
-                    'Recommendation': item.get('recommendation', ''),
-                    'Location': item.get('location', ''),
-                    'Condition': item.get('condition', ''),
-                    'Posted': item.get('posted', ''),
-                    'Seller Type': item.get('seller_type', ''),
-                    'URL': item.get('url', ''),
-                    'FINN ID': item.get('id', '')
-                }
+            if include_analysis:
+                factors = get('deal_factors', {})
+                details = factors.get('details', {})
                 
-                if include_analysis:
-                    factors = item.get('deal_factors', {})
-                    details = factors.get('details', {})
-                    
-                    row.update({
-                        'Price vs Average': details.get('price_vs_avg', ''),
-                        'Price Factor': factors.get('price_factor', ''),
-                        'Condition Factor': factors.get('condition_factor', ''),
-                    })
-                
-                writer.writerow(row)
+                row += (
+                    details.get('price_vs_avg', ''),
+                    factors.get('price_factor', ''),
+                    factors.get('condition_factor', ''),
+                )
+            
+            return row
+        
+        with open(filepath, 'w', buffering=WRITE_BUFFER_SIZE, newline='', encoding='utf-8-sig') as f:
+            writer = csv.writer(f, dialect=CSVExportDialect)
+            writer.writerow(columns)
+            writer.writerows(map(row_of, items))
         
         return str(filepath)
         
@@ -129,37 +497,29 @@ class ExportManager:
         self,
         items: List[Dict],
         filename: str,
-        include_analysis: bool
+        include_analysis: bool,
+        now: Optional[datetime] = None
     ) -> str:
         """Export items to Excel format"""
-        try:
-            import openpyxl
-            from openpyxl.styles import Font, Fill, PatternFill, Alignment, Border, Side
-            from openpyxl.utils import get_column_letter
-        except ImportError:
+        if openpyxl is None:
             # Fallback to CSV if openpyxl not available
             print("openpyxl not available, falling back to CSV")
             return self._export_csv(items, filename, include_analysis)
         
+        if now is None:
+            now = datetime.now()
+        
         filepath = self.output_dir / f'{filename}.xlsx'
         
-        wb = openpyxl.Workbook()
-        ws = wb.active
-        ws.title = "FINN Deals"
-        
-        # Define styles
-        header_font = Font(bold=True, color="FFFFFF")
-        header_fill = PatternFill(start_color="4F46E5", end_color="4F46E5", fill_type="solid")
-        deal_fill = PatternFill(start_color="DCFCE7", end_color="DCFCE7", fill_type="solid")
-        great_deal_fill = PatternFill(start_color="86EFAC", end_color="86EFAC", fill_type="solid")
-        excellent_deal_fill = PatternFill(start_color="4ADE80", end_color="4ADE80", fill_type="solid")
-        
-        thin_border = Border(
-            left=Side(style='thin'),
-            right=Side(style='thin'),
-            top=Side(style='thin'),
-            bottom=Side(style='thin')
-        )
+        # Write-only mode streams rows to disk instead of keeping every cell
+        # in memory, so cells can't be read back or restyled afterwards
+        wb = openpyxl.Workbook(write_only=True)
+        ws = wb.create_sheet("FINN Deals")
+        
+        # Highlighted cells only differ by row fill, so each variant is
+        # registered once as a named style and assigned per cell by name
+        for name, fill in EXCEL_ROW_STYLES:
+            wb.add_named_style(NamedStyle(name=name, border=EXCEL_THIN_BORDER, fill=fill))
         
         # Headers
         headers = [
@@ -175,88 +535,110 @@ class ExportManager:
             'URL'
         ]
         
-        for col, header in enumerate(headers, 1):
-            cell = ws.cell(row=1, column=col, value=header)
-            cell.font = header_font
-            cell.fill = header_fill
-            cell.alignment = Alignment(horizontal='center')
-            cell.border = thin_border
-        
-        # Data rows
-        for row_num, item in enumerate(items, 2):
-            deal_score = item.get('deal_score', 0)
+        def styled_row(item: Dict) -> tuple:
+            get = item.get
+            deal_score = get('deal_score', 0)
             
-            # Determine row fill based on deal score
+            # Determine row style based on deal score
             if deal_score >= 90:
-                row_fill = excellent_deal_fill
+                row_style = 'excellent_deal_row'
             elif deal_score >= 80:
-                row_fill = great_deal_fill
+                row_style = 'great_deal_row'
             elif deal_score >= 70:
-                row_fill = deal_fill
+                row_style = 'good_deal_row'
             else:
-                row_fill = None
+                row_style = None
             
             row_data = [
-                item.get('title', ''),
-                item.get('price', 0),
-                item.get('avg_price', 0),
+                get('title', ''),
+                get('price', 0),
+                get('avg_price', 0),
                 f"{deal_score}%",
-                item.get('recommendation', ''),
-                item.get('location', ''),
-                item.get('condition', ''),
-                item.get('posted', ''),
-                item.get('seller_type', ''),
-                item.get('url', '')
+                get('recommendation', ''),
+                get('location', ''),
+                get('condition', ''),
+                get('posted', ''),
+                get('seller_type', ''),
+                get('url', '')
             ]
             
-            for col, value in enumerate(row_data, 1):
-                cell = ws.cell(row=row_num, column=col, value=value)
-                cell.border = thin_border
-                if row_fill:
-                    cell.fill = row_fill
-        
-        # Auto-adjust column widths
-        for col in range(1, len(headers) + 1):
-            column_letter = get_column_letter(col)
-            max_length = max(
-                len(str(ws.cell(row=row, column=col).value or ''))
-                for row in range(1, min(len(items) + 2, 100))  # Check first 100 rows
-            )
-            adjusted_width = min(max_length + 2, 50)
-            ws.column_dimensions[column_letter].width = adjusted_width
+            return row_style, row_data
+        
+        rows = map(styled_row, items)
+        
+        # Column widths must be set before any row is written, so size them
+        # from the first rows up front and write those rows afterwards
+        sample = list(islice(rows, EXCEL_WIDTH_SAMPLE_ROWS))
+        widths = [len(header) for header in headers]
+        for _, row_data in sample:
+            for col, value in enumerate(row_data):
+                length = len(str(value or ''))
+                if length > widths[col]:
+                    widths[col] = length
+        
+        for col, width in enumerate(widths, 1):
+            ws.column_dimensions[get_column_letter(col)].width = min(width + 2, EXCEL_MAX_COLUMN_WIDTH)
         
         # Freeze header row
         ws.freeze_panes = 'A2'
         
+        header_cells = []
+        for header in headers:
+            cell = WriteOnlyCell(ws, value=header)
+            cell.font = EXCEL_HEADER_FONT
+            cell.fill = EXCEL_HEADER_FILL
+            cell.alignment = EXCEL_HEADER_ALIGNMENT
+            cell.border = EXCEL_THIN_BORDER
+            header_cells.append(cell)
+        ws.append(header_cells)
+        
+        # Data rows
+        for row_style, row_data in chain(sample, rows):
+            # Plain rows go out as bare values without any cell styling
+            if row_style is None:
+                ws.append(row_data)
+                continue
+            
+            row_cells = []
+            for value in row_data:
+                cell = WriteOnlyCell(ws, value=value)
+                cell.style = row_style
+                row_cells.append(cell)
+            ws.append(row_cells)
+        
         # Add statistics sheet
         stats_ws = wb.create_sheet("Statistics")
         
         if items:
-            prices = [item.get('price', 0) for item in items if item.get('price', 0) > 0]
-            deal_scores = [item.get('deal_score', 0) for item in items]
-            hot_deals = len([s for s in deal_scores if s >= 70])
+            export_stats = self._calculate_export_stats(items)
+            has_prices = export_stats['items_with_price'] > 0
+            hot_deals = (
+                export_stats['excellent_deals']
+                + export_stats['great_deals']
+                + export_stats['good_deals']
+            )
             
             stats = [
-                ('Statistic', 'Value'),
                 ('Total Items', len(items)),
                 ('Hot Deals (70%+)', hot_deals),
-                ('Average Price', f"{sum(prices)/len(prices):,.0f} kr" if prices else "N/A"),
-                ('Min Price', f"{min(prices):,} kr" if prices else "N/A"),
-                ('Max Price', f"{max(prices):,} kr" if prices else "N/A"),
-                ('Average Deal Score', f"{sum(deal_scores)/len(deal_scores):.1f}%" if deal_scores else "N/A"),
-                ('Best Deal Score', f"{max(deal_scores)}%" if deal_scores else "N/A"),
-                ('Export Date', datetime.now().strftime('%Y-%m-%d %H:%M:%S')),
+                ('Average Price', _format_kr(export_stats['average_price']) if has_prices else "N/A"),
+                ('Min Price', f"{export_stats['min_price']:,} kr" if has_prices else "N/A"),
+                ('Max Price', f"{export_stats['max_price']:,} kr" if has_prices else "N/A"),
+                ('Average Deal Score', _format_percent(export_stats['average_deal_score'])),
+                ('Best Deal Score', f"{export_stats['best_deal_score']}%"),
+                ('Export Date', now.strftime('%Y-%m-%d %H:%M:%S')),
             ]
             
-            for row_num, (label, value) in enumerate(stats, 1):
-                stats_ws.cell(row=row_num, column=1, value=label)
-                stats_ws.cell(row=row_num, column=2, value=value)
-                
-                if row_num == 1:
-                    stats_ws.cell(row=row_num, column=1).font = header_font
-                    stats_ws.cell(row=row_num, column=1).fill = header_fill
-                    stats_ws.cell(row=row_num, column=2).font = header_font
-                    stats_ws.cell(row=row_num, column=2).fill = header_fill
+            stats_header = []
+            for label in ('Statistic', 'Value'):
+                cell = WriteOnlyCell(stats_ws, value=label)
+                cell.font = EXCEL_HEADER_FONT
+                cell.fill = EXCEL_HEADER_FILL
+                stats_header.append(cell)
+            stats_ws.append(stats_header)
+            
+            for row in stats:
+                stats_ws.append(row)
         
         wb.save(filepath)
         return str(filepath)
@@ -265,15 +647,19 @@ class ExportManager:
         self,
         items: List[Dict],
         filename: str,
-        include_analysis: bool
+        include_analysis: bool,
+        now: Optional[datetime] = None
     ) -> str:
         """Export items to JSON format"""
+        if now is None:
+            now = datetime.now()
+        
         filepath = self.output_dir / f'{filename}.json'
         
         # Prepare export data
         export_data = {
             'export_info': {
-                'generated_at': datetime.now().isoformat(),
+                'generated_at': now.isoformat(),
                 'total_items': len(items),
                 'source': 'FINN.no Deal Finder Pro'
             },
@@ -281,47 +667,63 @@ class ExportManager:
             'items': items if include_analysis else self._strip_analysis(items)
         }
         
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(export_data, f, indent=2, ensure_ascii=False)
+        with open(filepath, 'wb', buffering=WRITE_BUFFER_SIZE) as f:
+            f.write(_dumps_indented(export_data))
         
         return str(filepath)
         
     def _strip_analysis(self, items: List[Dict]) -> List[Dict]:
         """Remove analysis data from items for basic export"""
-        stripped = []
-        for item in items:
-            stripped_item = {
-                'id': item.get('id'),
-                'title': item.get('title'),
-                'price': item.get('price'),
-                'location': item.get('location'),
-                'condition': item.get('condition'),
-                'posted': item.get('posted'),
-                'url': item.get('url'),
-                'seller_type': item.get('seller_type')
-            }
-            stripped.append(stripped_item)
-        return stripped
+        keys = STRIP_ANALYSIS_KEYS
+        return [dict(zip(keys, map(item.get, keys))) for item in items]
         
     def _calculate_export_stats(self, items: List[Dict]) -> Dict:
         """Calculate statistics for export"""
         if not items:
             return {}
         
-        prices = [item.get('price', 0) for item in items if item.get('price', 0) > 0]
-        deal_scores = [item.get('deal_score', 0) for item in items]
+        # One pass over the items instead of a list and a scan per figure
+        price_sum = price_count = 0
+        min_price = max_price = 0
+        score_sum = 0
+        best_score = None
+        excellent = great = good = 0
+        
+        for item in items:
+            price = item.get('price', 0)
+            if price > 0:
+                if price_count:
+                    if price < min_price:
+                        min_price = price
+                    elif price > max_price:
+                        max_price = price
+                else:
+                    min_price = max_price = price
+                price_sum += price
+                price_count += 1
+            
+            score = item.get('deal_score', 0)
+            score_sum += score
+            if best_score is None or score > best_score:
+                best_score = score
+            if score >= 90:
+                excellent += 1
+            elif score >= 80:
+                great += 1
+            elif score >= 70:
+                good += 1
         
         return {
             'total_items': len(items),
-            'items_with_price': len(prices),
-            'average_price': sum(prices) / len(prices) if prices else 0,
-            'min_price': min(prices) if prices else 0,
-            'max_price': max(prices) if prices else 0,
-            'average_deal_score': sum(deal_scores) / len(deal_scores) if deal_scores else 0,
-            'best_deal_score': max(deal_scores) if deal_scores else 0,
-            'excellent_deals': len([s for s in deal_scores if s >= 90]),
-            'great_deals': len([s for s in deal_scores if 80 <= s < 90]),
-            'good_deals': len([s for s in deal_scores if 70 <= s < 80]),
+            'items_with_price': price_count,
+            'average_price': price_sum / price_count if price_count else 0,
+            'min_price': min_price,
+            'max_price': max_price,
+            'average_deal_score': score_sum / len(items),
+            'best_deal_score': best_score,
+            'excellent_deals': excellent,
+            'great_deals': great,
+            'good_deals': good,
         }
         
     def create_print_report(
@@ -331,88 +733,37 @@ class ExportManager:
         title: str = "FINN.no Deal Report"
     ) -> str:
         """Create an HTML report for printing"""
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        now = datetime.now()
+        timestamp = now.strftime('%Y%m%d_%H%M%S')
         filepath = self.output_dir / f'finn_report_{timestamp}.html'
         
         # Calculate statistics
         stats = self._calculate_export_stats(items)
         
-        # Sort items by deal score
-        sorted_items = sorted(items, key=lambda x: x.get('deal_score', 0), reverse=True)
-        
-        # Generate HTML
-        html_content = self._generate_print_html(
-            title=title,
-            items=sorted_items,
-            stats=stats,
-            search_params=search_params
-        )
+        # Sort items by deal score, unless they already arrive that way
+        scores = [item.get('deal_score', 0) for item in items]
+        if all(a >= b for a, b in zip(scores, islice(scores, 1, None))):
+            sorted_items = items
+        else:
+            order = sorted(range(len(items)), key=scores.__getitem__, reverse=True)
+            sorted_items = [items[i] for i in order]
         
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(html_content)
+        # Stream the report to disk row by row
+        with open(filepath, 'w', buffering=WRITE_BUFFER_SIZE, encoding='utf-8') as f:
+            f.write(self._html_header(title, stats, search_params))
+            for i, item in enumerate(sorted_items, 1):
+                f.write(self._html_row(i, item))
+            f.write(self._html_footer(now))
         
         return str(filepath)
         
-    def _generate_print_html(
+    def _html_header(
         self,
         title: str,
-        items: List[Dict],
         stats: Dict,
         search_params: Dict = None
     ) -> str:
-        """Generate HTML content for print report"""
-        
-        # Generate item rows
-        item_rows = []
-        for i, item in enumerate(items, 1):
-            deal_score = item.get('deal_score', 0)
-            
-            # Determine deal class
-            if deal_score >= 90:
-                deal_class = 'excellent'
-                deal_badge = '🔥 EXCELLENT'
-            elif deal_score >= 80:
-                deal_class = 'great'
-                deal_badge = '⭐ GREAT'
-            elif deal_score >= 70:
-                deal_class = 'good'
-                deal_badge = '👍 GOOD'
-            else:
-                deal_class = 'normal'
-                deal_badge = ''
-            
-            price = item.get('price', 0)
-            avg_price = item.get('avg_price', 0)
-            
-            savings = ''
-            if avg_price > price > 0:
-                savings = f'<span class="savings">💰 Save {avg_price - price:,.0f} kr</span>'
-            
-            item_rows.append(f'''
-                <tr class="item-row {deal_class}">
-                    <td class="rank">{i}</td>
-                    <td class="title">
-                        <strong>{html.escape(item.get('title', 'N/A')[:60])}</strong>
-                        {f'<span class="deal-badge">{deal_badge}</span>' if deal_badge else ''}
-                        <br><small class="location">📍 {html.escape(item.get('location', 'N/A'))}</small>
-                    </td>
-                    <td class="price">
-                        <strong>{price:,.0f} kr</strong>
-                        {savings}
-                    </td>
-                    <td class="score">
-                        <div class="score-bar">
-                            <div class="score-fill {deal_class}" style="width: {deal_score}%"></div>
-                        </div>
-                        <span>{deal_score}%</span>
-                    </td>
-                    <td class="condition">{html.escape(item.get('condition', 'N/A'))}</td>
-                    <td class="link">
-                        <a href="{item.get('url', '#')}" target="_blank">View</a>
-                    </td>
-                </tr>
-            ''')
-        
+        """Generate the print report HTML up to the first item row"""
         # Build search info
         search_info = ''
         if search_params:
@@ -427,254 +778,14 @@ class ExportManager:
             if search_details:
                 search_info = ' | '.join(search_details)
         
-        html_content = f'''
+        return f'''
 <!DOCTYPE html>
 <html lang="no">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>{html.escape(title)}</title>
-    <style>
-        * {{
-            margin: 0;
-            padding: 0;
-            box-sizing: border-box;
-        }}
-        
-        body {{
-            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, Oxygen, Ubuntu, sans-serif;
-            line-height: 1.6;
-            color: #1e293b;
-            background: #f8fafc;
-            padding: 20px;
-        }}
-        
-        .container {{
-            max-width: 1200px;
-            margin: 0 auto;
-            background: white;
-            border-radius: 12px;
-            box-shadow: 0 4px 6px -1px rgba(0, 0, 0, 0.1);
-            overflow: hidden;
-        }}
-        
-        .header {{
-            background: linear-gradient(135deg, #4f46e5 0%, #7c3aed 100%);
-            color: white;
-            padding: 30px;
-            text-align: center;
-        }}
-        
-        .header h1 {{
-            font-size: 2rem;
-            margin-bottom: 10px;
-        }}
-        
-        .header .subtitle {{
-            opacity: 0.9;
-            font-size: 1.1rem;
-        }}
-        
-        .search-info {{
-            background: rgba(255,255,255,0.1);
-            padding: 10px 20px;
-            border-radius: 8px;
-            margin-top: 15px;
-            display: inline-block;
-        }}
-        
-        .stats-grid {{
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(150px, 1fr));
-            gap: 15px;
-            padding: 25px;
-            background: #f1f5f9;
-        }}
-        
-        .stat-card {{
-            background: white;
-            padding: 15px;
-            border-radius: 8px;
-            text-align: center;
-            box-shadow: 0 1px 3px rgba(0,0,0,0.1);
-        }}
-        
-        .stat-value {{
-            font-size: 1.8rem;
-            font-weight: bold;
-            color: #4f46e5;
-        }}
-        
-        .stat-label {{
-            font-size: 0.85rem;
-            color: #64748b;
-            margin-top: 5px;
-        }}
-        
-        .deals-table {{
-            width: 100%;
-            border-collapse: collapse;
-        }}
-        
-        .deals-table th {{
-            background: #1e293b;
-            color: white;
-            padding: 15px 12px;
-            text-align: left;
-            font-weight: 600;
-            position: sticky;
-            top: 0;
-        }}
-        
-        .item-row {{
-            border-bottom: 1px solid #e2e8f0;
-            transition: background 0.2s;
-        }}
-        
-        .item-row:hover {{
-            background: #f8fafc;
-        }}
-        
-        .item-row td {{
-            padding: 15px 12px;
-            vertical-align: top;
-        }}
-        
-        .item-row.excellent {{
-            background: linear-gradient(90deg, #dcfce7 0%, white 100%);
-        }}
-        
-        .item-row.great {{
-            background: linear-gradient(90deg, #fef9c3 0%, white 100%);
-        }}
-        
-        .item-row.good {{
-            background: linear-gradient(90deg, #e0f2fe 0%, white 100%);
-        }}
-        
-        .rank {{
-            width: 40px;
-            font-weight: bold;
-            color: #64748b;
-        }}
-        
-        .title {{
-            max-width: 350px;
-        }}
-        
-        .title strong {{
-            color: #1e293b;
-        }}
-        
-        .location {{
-            color: #64748b;
-        }}
-        
-        .deal-badge {{
-            display: inline-block;
-            padding: 2px 8px;
-            border-radius: 4px;
-            font-size: 0.75rem;
-            font-weight: bold;
-            margin-left: 8px;
-            background: #4f46e5;
-            color: white;
-        }}
-        
-        .price {{
-            font-size: 1.1rem;
-        }}
-        
-        .savings {{
-            display: block;
-            color: #059669;
-            font-size: 0.85rem;
-            margin-top: 4px;
-        }}
-        
-        .score {{
-            width: 120px;
-        }}
-        
-        .score-bar {{
-            width: 80px;
-            height: 8px;
-            background: #e2e8f0;
-            border-radius: 4px;
-            overflow: hidden;
-            display: inline-block;
-            vertical-align: middle;
-            margin-right: 8px;
-        }}
-        
-        .score-fill {{
-            height: 100%;
-            border-radius: 4px;
-            transition: width 0.3s;
-        }}
-        
-        .score-fill.excellent {{
-            background: #22c55e;
-        }}
-        
-        .score-fill.great {{
-            background: #84cc16;
-        }}
-        
-        .score-fill.good {{
-            background: #eab308;
-        }}
-        
-        .score-fill.normal {{
-            background: #94a3b8;
-        }}
-        
-        .link a {{
-            color: #4f46e5;
-            text-decoration: none;
-            font-weight: 500;
-        }}
-        
-        .link a:hover {{
-            text-decoration: underline;
-        }}
-        
-        .footer {{
-            text-align: center;
-            padding: 20px;
-            background: #f1f5f9;
-            color: #64748b;
-            font-size: 0.9rem;
-        }}
-        
-        @media print {{
-            body {{
-                padding: 0;
-                background: white;
-            }}
-            
-            .container {{
-                box-shadow: none;
-            }}
-            
-            .header {{
-                background: #4f46e5 !important;
-                -webkit-print-color-adjust: exact;
-                print-color-adjust: exact;
-            }}
-            
-            .item-row.excellent,
-            .item-row.great,
-            .item-row.good {{
-                -webkit-print-color-adjust: exact;
-                print-color-adjust: exact;
-            }}
-            
-            .link {{
-                display: none;
-            }}
-        }}
-    </style>
+    {PRINT_REPORT_STYLE}
 </head>
 <body>
     <div class="container">
@@ -694,7 +805,7 @@ class ExportManager:
                 <div class="stat-label">Hot Deals</div>
             </div>
             <div class="stat-card">
-                <div class="stat-value">{stats.get('average_price', 0):,.0f} kr</div>
+                <div class="stat-value">{_format_kr(stats.get('average_price', 0))}</div>
                 <div class="stat-label">Avg. Price</div>
             </div>
             <div class="stat-card">
@@ -702,11 +813,11 @@ class ExportManager:
                 <div class="stat-label">Best Score</div>
             </div>
             <div class="stat-card">
-                <div class="stat-value">{stats.get('min_price', 0):,.0f} kr</div>
+                <div class="stat-value">{_format_kr(stats.get('min_price', 0))}</div>
                 <div class="stat-label">Min Price</div>
             </div>
             <div class="stat-card">
-                <div class="stat-value">{stats.get('max_price', 0):,.0f} kr</div>
+                <div class="stat-value">{_format_kr(stats.get('max_price', 0))}</div>
                 <div class="stat-label">Max Price</div>
             </div>
         </div>
@@ -723,17 +834,44 @@ class ExportManager:
                 </tr>
             </thead>
             <tbody>
-                {''.join(item_rows)}
+                '''
+        
+    def _html_row(self, rank: int, item: Dict) -> str:
+        """Generate the print report table row for one item"""
+        get = item.get
+        deal_score = get('deal_score', 0)
+        price = get('price', 0)
+        avg_price = get('avg_price', 0)
+        
+        savings = ''
+        if avg_price > price > 0:
+            savings = f'<span class="savings">💰 Save {_format_kr(avg_price - price)}</span>'
+        
+        # Pick the template for the item's deal band
+        template = PRINT_ROW_TEMPLATES[bisect_right(PRINT_DEAL_EDGES, deal_score)]
+        
+        return template.format(
+            rank=rank,
+            title=html.escape(get('title', 'N/A')[:60]),
+            location=html.escape(get('location', 'N/A')),
+            price=price,
+            savings=savings,
+            deal_score=deal_score,
+            condition=html.escape(get('condition', 'N/A')),
+            url=get('url', '#'),
+        )
+        
+    def _html_footer(self, now: datetime) -> str:
+        """Generate the print report HTML after the last item row"""
+        return f'''
             </tbody>
         </table>
         
         <div class="footer">
-            <p>Report generated on {datetime.now().strftime('%B %d, %Y at %H:%M')}</p>
+            <p>Report generated on {now.strftime('%B %d, %Y at %H:%M')}</p>
             <p>Data source: FINN.no | Tool: Deal Finder Pro v1.0</p>
         </div>
     </div>
 </body>
 </html>
 '''
-        
-        return html_content
@@ -36,19 +36,11 @@ class ModernGradientFrame(ctk.CTkFrame):
 
 
 class AnimatedButton(ctk.CTkButton):
-    """Button with hover animation effect"""
+    """Button with hover effect, using CTkButton's built-in hover color"""
     def __init__(self, master, **kwargs):
-        self.original_color = kwargs.get('fg_color', '#6366f1')
-        self.hover_color = kwargs.get('hover_color', '#818cf8')
+        kwargs.setdefault('fg_color', '#6366f1')
+        kwargs.setdefault('hover_color', '#818cf8')
         super().__init__(master, **kwargs)
-        self.bind('<Enter>', self._on_enter)
-        self.bind('<Leave>', self._on_leave)
-
-    def _on_enter(self, event):
-        self.configure(fg_color=self.hover_color)
-
-    def _on_leave(self, event):
-        self.configure(fg_color=self.original_color)
 
 
 class FinnDealFinderApp(ctk.CTk):
@@ -178,6 +170,35 @@ class FinnDealFinderApp(ctk.CTk):
         'Eldste først (Oldest)': 'sort=PUBLISHED_ASC',
     }
 
+    # Option menu values, built once from the tables above
+    CATEGORY_NAMES = tuple(CATEGORIES)
+    SUBCATEGORY_NAMES = {
+        name: tuple(data.get('subcategories', {}))
+        for name, data in CATEGORIES.items()
+    }
+    LOCATION_NAMES = tuple(LOCATIONS)
+
+    # (category, subcategory) -> (url_base, subcategory query); the '' entry
+    # per category covers categories without subcategories
+    CATEGORY_QUERIES = {
+        (name, subcategory): (data.get('url_base', ''), query)
+        for name, data in CATEGORIES.items()
+        for subcategory, query in {'': '', **data.get('subcategories', {})}.items()
+    }
+    CONDITION_NAMES = tuple(CONDITIONS)
+    SORT_OPTION_NAMES = tuple(SORT_OPTIONS)
+
+    # Size and spacing of the header statistics cards
+    STAT_CARD_WIDTH = 180
+    STAT_CARD_HEIGHT = 70
+    STAT_CARD_GAP = 30
+
+    # Slider label updates wait this long for the drag to pause
+    SLIDER_LABEL_DELAY_MS = 40
+
+    # Result cards created per page; the rest are created on request
+    RESULTS_PAGE_SIZE = 25
+
     def __init__(self):
         super().__init__()
 
@@ -190,9 +211,17 @@ class FinnDealFinderApp(ctk.CTk):
         # Application state
         self.current_results = []
         self.saved_searches = []
+        self.saved_searches_ready = False
         self.is_scraping = False
         self.progress_value = 0
 
+        # Pending slider label updates
+        self._max_results_after_id = None
+        self._threshold_after_id = None
+
+        # Fonts shared by every widget that uses the same family, size and weight
+        self._fonts = {}
+
         # Configure window
         self.title("🔍 FINN.no Deal Finder Pro")
         self.geometry("1600x950")
@@ -217,6 +246,14 @@ class FinnDealFinderApp(ctk.CTk):
         self.bind('<F5>', lambda e: self._start_search())
         self.bind('<Escape>', lambda e: self._stop_search())
 
+    def _font(self, size: int, weight: str = None, family: str = None) -> ctk.CTkFont:
+        """Get a shared font, creating it on first use"""
+        key = (family, size, weight)
+        font = self._fonts.get(key)
+        if font is None:
+            font = self._fonts[key] = ctk.CTkFont(family=family, size=size, weight=weight)
+        return font
+
     def _create_sidebar(self):
         """Create the left sidebar with search filters"""
         # Sidebar container
@@ -236,7 +273,6 @@ class FinnDealFinderApp(ctk.CTk):
             scrollbar_fg_color=self.COLORS['bg_tertiary'],
             scrollbar_button_color=self.COLORS['accent_primary']
         )
-        self.sidebar_scroll.pack(fill="both", expand=True, padx=10, pady=10)
 
         # Logo and title section
         self._create_logo_section()
@@ -247,6 +283,10 @@ class FinnDealFinderApp(ctk.CTk):
         # Saved searches section
         self._create_saved_searches_section()
 
+        # Map the sidebar content only once every widget is in place, so the
+        # layout is computed in one pass rather than after each pack
+        self.sidebar_scroll.pack(fill="both", expand=True, padx=10, pady=10)
+
     def _create_logo_section(self):
         """Create the logo and branding section"""
         logo_frame = ctk.CTkFrame(self.sidebar_scroll, fg_color="transparent")
@@ -256,7 +296,7 @@ class FinnDealFinderApp(ctk.CTk):
         title_label = ctk.CTkLabel(
             logo_frame,
             text="🏆 FINN Deal Finder",
-            font=ctk.CTkFont(family="Segoe UI", size=28, weight="bold"),
+            font=self._font(family="Segoe UI", size=28, weight="bold"),
             text_color=self.COLORS['text_primary']
         )
         title_label.pack()
@@ -264,7 +304,7 @@ class FinnDealFinderApp(ctk.CTk):
         subtitle_label = ctk.CTkLabel(
             logo_frame,
             text="Find the Best Deals in Norway",
-            font=ctk.CTkFont(family="Segoe UI", size=14),
+            font=self._font(family="Segoe UI", size=14),
             text_color=self.COLORS['text_secondary']
         )
         subtitle_label.pack(pady=(5, 0))
@@ -284,7 +324,7 @@ class FinnDealFinderApp(ctk.CTk):
         filter_header = ctk.CTkLabel(
             self.sidebar_scroll,
             text="🎯 Search Filters",
-            font=ctk.CTkFont(family="Segoe UI", size=18, weight="bold"),
+            font=self._font(family="Segoe UI", size=18, weight="bold"),
             text_color=self.COLORS['text_primary'],
             anchor="w"
         )
@@ -296,7 +336,7 @@ class FinnDealFinderApp(ctk.CTk):
             self.sidebar_scroll,
             placeholder_text="e.g., iPhone 15, Gaming PC, MacBook...",
             height=45,
-            font=ctk.CTkFont(size=14),
+            font=self._font(size=14),
             fg_color=self.COLORS['card_bg'],
             border_color=self.COLORS['border'],
             text_color=self.COLORS['text_primary']
@@ -309,9 +349,9 @@ class FinnDealFinderApp(ctk.CTk):
         self.category_menu = ctk.CTkOptionMenu(
             self.sidebar_scroll,
             variable=self.category_var,
-            values=list(self.CATEGORIES.keys()),
+            values=self.CATEGORY_NAMES,
             height=45,
-            font=ctk.CTkFont(size=14),
+            font=self._font(size=14),
             fg_color=self.COLORS['card_bg'],
             button_color=self.COLORS['accent_primary'],
             button_hover_color=self.COLORS['accent_secondary'],
@@ -326,9 +366,9 @@ class FinnDealFinderApp(ctk.CTk):
         self.subcategory_menu = ctk.CTkOptionMenu(
             self.sidebar_scroll,
             variable=self.subcategory_var,
-            values=list(self.CATEGORIES['Torget (Marketplace)']['subcategories'].keys()),
+            values=self.SUBCATEGORY_NAMES['Torget (Marketplace)'],
             height=45,
-            font=ctk.CTkFont(size=14),
+            font=self._font(size=14),
             fg_color=self.COLORS['card_bg'],
             button_color=self.COLORS['accent_primary'],
             button_hover_color=self.COLORS['accent_secondary'],
@@ -342,9 +382,9 @@ class FinnDealFinderApp(ctk.CTk):
         self.location_menu = ctk.CTkOptionMenu(
             self.sidebar_scroll,
             variable=self.location_var,
-            values=list(self.LOCATIONS.keys()),
+            values=self.LOCATION_NAMES,
             height=45,
-            font=ctk.CTkFont(size=14),
+            font=self._font(size=14),
             fg_color=self.COLORS['card_bg'],
             button_color=self.COLORS['accent_primary'],
             button_hover_color=self.COLORS['accent_secondary'],
@@ -358,9 +398,9 @@ class FinnDealFinderApp(ctk.CTk):
         self.condition_menu = ctk.CTkOptionMenu(
             self.sidebar_scroll,
             variable=self.condition_var,
-            values=list(self.CONDITIONS.keys()),
+            values=self.CONDITION_NAMES,
             height=45,
-            font=ctk.CTkFont(size=14),
+            font=self._font(size=14),
             fg_color=self.COLORS['card_bg'],
             button_color=self.COLORS['accent_primary'],
             button_hover_color=self.COLORS['accent_secondary'],
@@ -378,7 +418,7 @@ class FinnDealFinderApp(ctk.CTk):
             placeholder_text="Min price",
             height=45,
             width=150,
-            font=ctk.CTkFont(size=14),
+            font=self._font(size=14),
             fg_color=self.COLORS['card_bg'],
             border_color=self.COLORS['border'],
             text_color=self.COLORS['text_primary']
@@ -388,7 +428,7 @@ class FinnDealFinderApp(ctk.CTk):
         dash_label = ctk.CTkLabel(
             price_frame,
             text="—",
-            font=ctk.CTkFont(size=16),
+            font=self._font(size=16),
             text_color=self.COLORS['text_secondary']
         )
         dash_label.pack(side="left", padx=5)
@@ -398,7 +438,7 @@ class FinnDealFinderApp(ctk.CTk):
             placeholder_text="Max price",
             height=45,
             width=150,
-            font=ctk.CTkFont(size=14),
+            font=self._font(size=14),
             fg_color=self.COLORS['card_bg'],
             border_color=self.COLORS['border'],
             text_color=self.COLORS['text_primary']
@@ -411,9 +451,9 @@ class FinnDealFinderApp(ctk.CTk):
         self.sort_menu = ctk.CTkOptionMenu(
             self.sidebar_scroll,
             variable=self.sort_var,
-            values=list(self.SORT_OPTIONS.keys()),
+            values=self.SORT_OPTION_NAMES,
             height=45,
-            font=ctk.CTkFont(size=14),
+            font=self._font(size=14),
             fg_color=self.COLORS['card_bg'],
             button_color=self.COLORS['accent_primary'],
             button_hover_color=self.COLORS['accent_secondary'],
@@ -433,14 +473,14 @@ class FinnDealFinderApp(ctk.CTk):
             fg_color=self.COLORS['bg_tertiary'],
             progress_color=self.COLORS['accent_primary'],
             button_color=self.COLORS['accent_secondary'],
-            command=self._update_max_results_label
+            command=self._schedule_max_results_label
         )
         self.max_results_slider.pack(fill="x", pady=(0, 5))
 
         self.max_results_label = ctk.CTkLabel(
             self.sidebar_scroll,
             text="50 results",
-            font=ctk.CTkFont(size=12),
+            font=self._font(size=12),
             text_color=self.COLORS['text_secondary']
         )
         self.max_results_label.pack(anchor="e", pady=(0, 20))
@@ -457,14 +497,14 @@ class FinnDealFinderApp(ctk.CTk):
             fg_color=self.COLORS['bg_tertiary'],
             progress_color=self.COLORS['accent_success'],
             button_color=self.COLORS['accent_success'],
-            command=self._update_threshold_label
+            command=self._schedule_threshold_label
         )
         self.deal_threshold_slider.pack(fill="x", pady=(0, 5))
 
         self.deal_threshold_label = ctk.CTkLabel(
             self.sidebar_scroll,
             text="Show deals scoring 70%+ (Good deals)",
-            font=ctk.CTkFont(size=12),
+            font=self._font(size=12),
             text_color=self.COLORS['accent_success']
         )
         self.deal_threshold_label.pack(anchor="e", pady=(0, 25))
@@ -477,7 +517,7 @@ class FinnDealFinderApp(ctk.CTk):
             button_frame,
             text="🔍 Find Deals",
             height=55,
-            font=ctk.CTkFont(family="Segoe UI", size=18, weight="bold"),
+            font=self._font(family="Segoe UI", size=18, weight="bold"),
             fg_color=self.COLORS['accent_primary'],
             hover_color=self.COLORS['accent_secondary'],
             corner_radius=12,
@@ -489,7 +529,7 @@ class FinnDealFinderApp(ctk.CTk):
             button_frame,
             text="⏹ Stop Search",
             height=45,
-            font=ctk.CTkFont(size=14),
+            font=self._font(size=14),
             fg_color=self.COLORS['accent_danger'],
             hover_color='#dc2626',
             corner_radius=10,
@@ -502,7 +542,7 @@ class FinnDealFinderApp(ctk.CTk):
             button_frame,
             text="💾 Save Search Criteria",
             height=45,
-            font=ctk.CTkFont(size=14),
+            font=self._font(size=14),
             fg_color=self.COLORS['bg_tertiary'],
             hover_color=self.COLORS['border'],
             border_color=self.COLORS['accent_primary'],
@@ -517,7 +557,7 @@ class FinnDealFinderApp(ctk.CTk):
         label = ctk.CTkLabel(
             self.sidebar_scroll,
             text=text,
-            font=ctk.CTkFont(family="Segoe UI", size=14, weight="bold"),
+            font=self._font(family="Segoe UI", size=14, weight="bold"),
             text_color=self.COLORS['text_secondary'],
             anchor="w"
         )
@@ -537,7 +577,7 @@ class FinnDealFinderApp(ctk.CTk):
         saved_header = ctk.CTkLabel(
             self.sidebar_scroll,
             text="💾 Saved Searches",
-            font=ctk.CTkFont(family="Segoe UI", size=18, weight="bold"),
+            font=self._font(family="Segoe UI", size=18, weight="bold"),
             text_color=self.COLORS['text_primary'],
             anchor="w"
         )
@@ -603,93 +643,101 @@ class FinnDealFinderApp(ctk.CTk):
         self.progress_label = ctk.CTkLabel(
             self.progress_frame,
             text="Ready to search...",
-            font=ctk.CTkFont(size=12),
+            font=self._font(size=12),
             text_color=self.COLORS['text_secondary']
         )
         self.progress_label.pack(anchor="e", pady=(5, 0))
 
-        # Stats row
-        stats_row = ctk.CTkFrame(stats_container, fg_color="transparent")
-        stats_row.pack(fill="x")
+        # Stats row: display-only cards drawn on one canvas
+        self.stats_canvas = tk.Canvas(
+            stats_container,
+            height=self.STAT_CARD_HEIGHT,
+            bg=self.COLORS['bg_secondary'],
+            highlightthickness=0
+        )
+        self.stats_canvas.pack(fill="x")
 
         # Total Results stat
         self.stat_total = self._create_stat_card(
-            stats_row,
+            0,
             "📊 Total Results",
             "0",
             self.COLORS['accent_primary']
         )
-        self.stat_total.pack(side="left", padx=(0, 15))
 
         # Great Deals stat
         self.stat_deals = self._create_stat_card(
-            stats_row,
+            1,
             "🔥 Hot Deals",
             "0",
             self.COLORS['accent_danger']
         )
-        self.stat_deals.pack(side="left", padx=15)
 
         # Average Price stat
         self.stat_avg_price = self._create_stat_card(
-            stats_row,
+            2,
             "💰 Avg. Price",
             "0 kr",
             self.COLORS['accent_success']
         )
-        self.stat_avg_price.pack(side="left", padx=15)
 
         # Best Deal stat
         self.stat_best_deal = self._create_stat_card(
-            stats_row,
+            3,
             "🏆 Best Deal Score",
             "—",
             self.COLORS['highlight']
         )
-        self.stat_best_deal.pack(side="left", padx=15)
 
         # Potential Savings stat
         self.stat_savings = self._create_stat_card(
-            stats_row,
+            4,
             "💵 Potential Savings",
             "0 kr",
             self.COLORS['accent_info']
         )
-        self.stat_savings.pack(side="left", padx=15)
-
-    def _create_stat_card(self, parent, title, value, color):
-        """Create a statistics card"""
-        card = ctk.CTkFrame(
-            parent,
-            width=180,
-            height=70,
-            fg_color=self.COLORS['card_bg'],
-            corner_radius=12,
-            border_width=1,
-            border_color=color
-        )
-        card.pack_propagate(False)
 
-        title_label = ctk.CTkLabel(
-            card,
+    def _create_stat_card(self, index, title, value, color):
+        """
+        Draw a statistics card on the stats canvas
+
+        Returns:
+            Canvas item id of the value text, for updates
+        """
+        x0 = index * (self.STAT_CARD_WIDTH + self.STAT_CARD_GAP)
+        x1 = x0 + self.STAT_CARD_WIDTH - 1
+        y1 = self.STAT_CARD_HEIGHT - 1
+        radius = 12
+
+        # Rounded rectangle as a smoothed polygon
+        self.stats_canvas.create_polygon(
+            x0 + radius, 0, x1 - radius, 0, x1, 0,
+            x1, radius, x1, y1 - radius, x1, y1,
+            x1 - radius, y1, x0 + radius, y1, x0, y1,
+            x0, y1 - radius, x0, radius, x0, 0,
+            smooth=True,
+            fill=self.COLORS['card_bg'],
+            outline=color
+        )
+
+        center = x0 + self.STAT_CARD_WIDTH // 2
+        self.stats_canvas.create_text(
+            center,
+            10,
             text=title,
-            font=ctk.CTkFont(size=11),
-            text_color=self.COLORS['text_secondary']
+            anchor="n",
+            font=self._font(size=11),
+            fill=self.COLORS['text_secondary']
         )
-        title_label.pack(pady=(10, 2))
 
-        value_label = ctk.CTkLabel(
-            card,
+        return self.stats_canvas.create_text(
+            center,
+            30,
             text=value,
-            font=ctk.CTkFont(family="Segoe UI", size=20, weight="bold"),
-            text_color=color
+            anchor="n",
+            font=self._font(family="Segoe UI", size=20, weight="bold"),
+            fill=color
         )
-        value_label.pack()
-
-        # Store reference for updates
-        card.value_label = value_label
-
-        return card
 
     def _create_tabview(self):
         """Create the tabview for different result views"""
@@ -701,7 +749,8 @@ class FinnDealFinderApp(ctk.CTk):
             segmented_button_selected_hover_color=self.COLORS['accent_secondary'],
             segmented_button_unselected_color=self.COLORS['bg_tertiary'],
             segmented_button_unselected_hover_color=self.COLORS['border'],
-            text_color=self.COLORS['text_primary']
+            text_color=self.COLORS['text_primary'],
+            command=self._on_tab_change
         )
         self.tabview.grid(row=1, column=0, sticky="nsew", padx=20, pady=(10, 0))
 
@@ -716,11 +765,24 @@ class FinnDealFinderApp(ctk.CTk):
             tab.grid_columnconfigure(0, weight=1)
             tab.grid_rowconfigure(0, weight=1)
 
-        # Create scrollable frames for each tab
+        # Only the visible tab is built up front; the others are built the
+        # first time they are selected or filled with results
         self._create_all_results_tab()
-        self._create_deals_tab()
-        self._create_compare_tab()
-        self._create_history_tab()
+        self._tab_builders = {
+            "🔥 Hot Deals": self._create_deals_tab,
+            "⚖️ Price Comparison": self._create_compare_tab,
+            "📈 Price History": self._create_history_tab,
+        }
+
+    def _build_tab(self, name: str):
+        """Build a deferred tab's content if it hasn't been built yet"""
+        builder = self._tab_builders.pop(name, None)
+        if builder is not None:
+            builder()
+
+    def _on_tab_change(self):
+        """Build the selected tab on first visit"""
+        self._build_tab(self.tabview.get())
 
     def _create_all_results_tab(self):
         """Create the all results tab content"""
@@ -736,7 +798,7 @@ class FinnDealFinderApp(ctk.CTk):
         self.all_results_placeholder = ctk.CTkLabel(
             self.all_results_scroll,
             text="🔍\n\nNo results yet.\nConfigure your search filters and click 'Find Deals' to start!",
-            font=ctk.CTkFont(size=16),
+            font=self._font(size=16),
             text_color=self.COLORS['text_muted'],
             justify="center"
         )
@@ -756,7 +818,7 @@ class FinnDealFinderApp(ctk.CTk):
         self.deals_placeholder = ctk.CTkLabel(
             self.deals_scroll,
             text="🔥\n\nHot deals will appear here!\nWe'll highlight items priced significantly below average.",
-            font=ctk.CTkFont(size=16),
+            font=self._font(size=16),
             text_color=self.COLORS['text_muted'],
             justify="center"
         )
@@ -776,7 +838,7 @@ class FinnDealFinderApp(ctk.CTk):
         self.compare_placeholder = ctk.CTkLabel(
             self.compare_scroll,
             text="⚖️\n\nPrice comparisons will appear here!\nSimilar products will be grouped for easy comparison.",
-            font=ctk.CTkFont(size=16),
+            font=self._font(size=16),
             text_color=self.COLORS['text_muted'],
             justify="center"
         )
@@ -796,7 +858,7 @@ class FinnDealFinderApp(ctk.CTk):
         self.history_placeholder = ctk.CTkLabel(
             self.history_scroll,
             text="📈\n\nPrice history tracking coming soon!\nTrack prices over time to find the best moment to buy.",
-            font=ctk.CTkFont(size=16),
+            font=self._font(size=16),
             text_color=self.COLORS['text_muted'],
             justify="center"
         )
@@ -826,7 +888,7 @@ class FinnDealFinderApp(ctk.CTk):
             text="📄 Export CSV",
             width=130,
             height=40,
-            font=ctk.CTkFont(size=13),
+            font=self._font(size=13),
             fg_color=self.COLORS['bg_tertiary'],
             hover_color=self.COLORS['border'],
             corner_radius=8,
@@ -839,7 +901,7 @@ class FinnDealFinderApp(ctk.CTk):
             text="📊 Export Excel",
             width=130,
             height=40,
-            font=ctk.CTkFont(size=13),
+            font=self._font(size=13),
             fg_color=self.COLORS['bg_tertiary'],
             hover_color=self.COLORS['border'],
             corner_radius=8,
@@ -852,7 +914,7 @@ class FinnDealFinderApp(ctk.CTk):
             text="🔗 Export JSON",
             width=130,
             height=40,
-            font=ctk.CTkFont(size=13),
+            font=self._font(size=13),
             fg_color=self.COLORS['bg_tertiary'],
             hover_color=self.COLORS['border'],
             corner_radius=8,
@@ -865,7 +927,7 @@ class FinnDealFinderApp(ctk.CTk):
             text="🖨️ Print Report",
             width=130,
             height=40,
-            font=ctk.CTkFont(size=13),
+            font=self._font(size=13),
             fg_color=self.COLORS['accent_info'],
             hover_color='#0891b2',
             corner_radius=8,
@@ -877,19 +939,48 @@ class FinnDealFinderApp(ctk.CTk):
         self.status_label = ctk.CTkLabel(
             footer_content,
             text="Ready • FINN.no Deal Finder Pro v1.0",
-            font=ctk.CTkFont(size=12),
+            font=self._font(size=12),
             text_color=self.COLORS['text_muted']
         )
         self.status_label.pack(side="right")
 
     def _on_category_change(self, value):
         """Handle category change event"""
-        category_data = self.CATEGORIES.get(value, {})
-        subcategories = list(category_data.get('subcategories', {}).keys())
+        subcategories = self.SUBCATEGORY_NAMES.get(value, ())
 
         self.subcategory_menu.configure(values=subcategories)
         self.subcategory_var.set(subcategories[0] if subcategories else '')
 
+    def _schedule_max_results_label(self, value):
+        """Update the max results label once the slider settles"""
+        if self._max_results_after_id is not None:
+            self.after_cancel(self._max_results_after_id)
+        self._max_results_after_id = self.after(
+            self.SLIDER_LABEL_DELAY_MS,
+            self._apply_max_results_label,
+            value
+        )
+
+    def _apply_max_results_label(self, value):
+        """Apply a debounced max results label update"""
+        self._max_results_after_id = None
+        self._update_max_results_label(value)
+
+    def _schedule_threshold_label(self, value):
+        """Update the threshold label once the slider settles"""
+        if self._threshold_after_id is not None:
+            self.after_cancel(self._threshold_after_id)
+        self._threshold_after_id = self.after(
+            self.SLIDER_LABEL_DELAY_MS,
+            self._apply_threshold_label,
+            value
+        )
+
+    def _apply_threshold_label(self, value):
+        """Apply a debounced threshold label update"""
+        self._threshold_after_id = None
+        self._update_threshold_label(value)
+
     def _update_max_results_label(self, value):
         """Update max results label"""
         self.max_results_label.configure(text=f"{int(value)} results")
@@ -910,8 +1001,31 @@ class FinnDealFinderApp(ctk.CTk):
         self.deal_threshold_label.configure(text=text, text_color=color)
 
     def _load_saved_searches(self):
-        """Load saved searches from file"""
-        self.saved_searches = self.data_manager.load_saved_searches()
+        """Load saved searches in the background so the window paints first"""
+        loading_label = ctk.CTkLabel(
+            self.saved_searches_frame,
+            text="Loading saved searches...",
+            font=self._font(size=12),
+            text_color=self.COLORS['text_muted'],
+            justify="center"
+        )
+        loading_label.pack(pady=20)
+
+        thread = threading.Thread(
+            target=self._read_saved_searches,
+            daemon=True
+        )
+        thread.start()
+
+    def _read_saved_searches(self):
+        """Read saved searches (in background thread)"""
+        searches = self.data_manager.load_saved_searches()
+        self.after(0, self._saved_searches_loaded, searches)
+
+    def _saved_searches_loaded(self, searches: list):
+        """Show saved searches once they have been read"""
+        self.saved_searches = searches
+        self.saved_searches_ready = True
         self._update_saved_searches_ui()
 
     def _update_saved_searches_ui(self):
@@ -924,7 +1038,7 @@ class FinnDealFinderApp(ctk.CTk):
             empty_label = ctk.CTkLabel(
                 self.saved_searches_frame,
                 text="No saved searches yet.\nSave your first search!",
-                font=ctk.CTkFont(size=12),
+                font=self._font(size=12),
                 text_color=self.COLORS['text_muted'],
                 justify="center"
             )
@@ -953,7 +1067,7 @@ class FinnDealFinderApp(ctk.CTk):
         name_label = ctk.CTkLabel(
             content,
             text=search.get('name', f'Search {index + 1}'),
-            font=ctk.CTkFont(size=13, weight="bold"),
+            font=self._font(size=13, weight="bold"),
             text_color=self.COLORS['text_primary'],
             anchor="w"
         )
@@ -967,7 +1081,7 @@ class FinnDealFinderApp(ctk.CTk):
         details_label = ctk.CTkLabel(
             content,
             text=details,
-            font=ctk.CTkFont(size=11),
+            font=self._font(size=11),
             text_color=self.COLORS['text_secondary'],
             anchor="w"
         )
@@ -982,7 +1096,7 @@ class FinnDealFinderApp(ctk.CTk):
             text="Load",
             width=60,
             height=28,
-            font=ctk.CTkFont(size=11),
+            font=self._font(size=11),
             fg_color=self.COLORS['accent_primary'],
             hover_color=self.COLORS['accent_secondary'],
             corner_radius=6,
@@ -995,7 +1109,7 @@ class FinnDealFinderApp(ctk.CTk):
             text="✕",
             width=28,
             height=28,
-            font=ctk.CTkFont(size=11),
+            font=self._font(size=11),
             fg_color=self.COLORS['accent_danger'],
             hover_color='#dc2626',
             corner_radius=6,
@@ -1005,6 +1119,10 @@ class FinnDealFinderApp(ctk.CTk):
 
     def _save_current_search(self):
         """Save the current search criteria"""
+        if not self.saved_searches_ready:
+            self.status_label.configure(text="⏳ Saved searches are still loading...")
+            return
+
         # Create dialog
         dialog = ctk.CTkInputDialog(
             text="Enter a name for this search:",
@@ -1030,8 +1148,13 @@ class FinnDealFinderApp(ctk.CTk):
             'saved_at': datetime.now().isoformat()
         }
 
+        # Only mirror the search in memory once the database has it, so list
+        # positions keep matching the rows that deletes go by
+        if not self.data_manager.add_saved_search(search_data):
+            self.status_label.configure(text=f"❌ Could not save search '{name}'")
+            return
+
         self.saved_searches.append(search_data)
-        self.data_manager.save_searches(self.saved_searches)
         self._update_saved_searches_ui()
 
         self.status_label.configure(text=f"✅ Search '{name}' saved successfully!")
@@ -1066,8 +1189,10 @@ class FinnDealFinderApp(ctk.CTk):
         """Delete a saved search"""
         if 0 <= index < len(self.saved_searches):
             name = self.saved_searches[index].get('name', 'Search')
+            if not self.data_manager.delete_saved_search(index):
+                self.status_label.configure(text=f"❌ Could not delete search: {name}")
+                return
             del self.saved_searches[index]
-            self.data_manager.save_searches(self.saved_searches)
             self._update_saved_searches_ui()
             self.status_label.configure(text=f"🗑️ Deleted search: {name}")
 
@@ -1096,14 +1221,15 @@ class FinnDealFinderApp(ctk.CTk):
     def _build_search_params(self) -> dict:
         """Build the search parameters from UI"""
         category = self.category_var.get()
-        category_data = self.CATEGORIES.get(category, {})
+        url_base, subcategory = (
+            self.CATEGORY_QUERIES.get((category, self.subcategory_var.get()))
+            or self.CATEGORY_QUERIES.get((category, ''), ('', ''))
+        )
 
         params = {
-            'url_base': category_data.get('url_base', ''),
+            'url_base': url_base,
             'keyword': self.search_entry.get(),
-            'subcategory': category_data.get('subcategories', {}).get(
-                self.subcategory_var.get(), ''
-            ),
+            'subcategory': subcategory,
             'location': self.LOCATIONS.get(self.location_var.get(), ''),
             'condition': self.CONDITIONS.get(self.condition_var.get(), ''),
             'price_min': self.price_min_entry.get(),
@@ -1193,22 +1319,22 @@ class FinnDealFinderApp(ctk.CTk):
         stats = results.get('stats', {})
 
         # Update stat cards
-        self.stat_total.value_label.configure(text=str(len(items)))
+        self.stats_canvas.itemconfigure(self.stat_total, text=str(len(items)))
 
         hot_deals = len([
             i for i in items
             if i.get('deal_score', 0) >= self.deal_threshold_var.get()
         ])
-        self.stat_deals.value_label.configure(text=str(hot_deals))
+        self.stats_canvas.itemconfigure(self.stat_deals, text=str(hot_deals))
 
         avg_price = stats.get('avg_price', 0)
-        self.stat_avg_price.value_label.configure(text=f"{avg_price:,.0f} kr")
+        self.stats_canvas.itemconfigure(self.stat_avg_price, text=f"{avg_price:,.0f} kr")
 
         best_score = stats.get('best_deal_score', 0)
-        self.stat_best_deal.value_label.configure(text=f"{best_score}%")
+        self.stats_canvas.itemconfigure(self.stat_best_deal, text=f"{best_score}%")
 
         savings = stats.get('potential_savings', 0)
-        self.stat_savings.value_label.configure(text=f"{savings:,.0f} kr")
+        self.stats_canvas.itemconfigure(self.stat_savings, text=f"{savings:,.0f} kr")
 
     def _populate_all_results(self, items: list):
         """Populate the all results tab"""
@@ -1220,7 +1346,7 @@ class FinnDealFinderApp(ctk.CTk):
             placeholder = ctk.CTkLabel(
                 self.all_results_scroll,
                 text="🔍\n\nNo results found.\nTry adjusting your search filters.",
-                font=ctk.CTkFont(size=16),
+                font=self._font(size=16),
                 text_color=self.COLORS['text_muted'],
                 justify="center"
             )
@@ -1228,11 +1354,12 @@ class FinnDealFinderApp(ctk.CTk):
             return
 
         # Create result cards
-        for item in items:
-            self._create_result_card(self.all_results_scroll, item)
+        self._render_result_cards(self.all_results_scroll, items)
 
     def _populate_deals(self, items: list):
         """Populate the hot deals tab"""
+        self._build_tab("🔥 Hot Deals")
+
         # Clear existing
         for widget in self.deals_scroll.winfo_children():
             widget.destroy()
@@ -1241,7 +1368,7 @@ class FinnDealFinderApp(ctk.CTk):
             placeholder = ctk.CTkLabel(
                 self.deals_scroll,
                 text="🔥\n\nNo hot deals found.\nTry lowering the deal threshold or broadening your search.",
-                font=ctk.CTkFont(size=16),
+                font=self._font(size=16),
                 text_color=self.COLORS['text_muted'],
                 justify="center"
             )
@@ -1251,11 +1378,38 @@ class FinnDealFinderApp(ctk.CTk):
         # Sort by deal score
         items.sort(key=lambda x: x.get('deal_score', 0), reverse=True)
 
-        for item in items:
-            self._create_result_card(self.deals_scroll, item, highlight=True)
+        self._render_result_cards(self.deals_scroll, items, highlight=True)
+
+    def _render_result_cards(self, parent, items: list, highlight: bool = False, start: int = 0):
+        """Create result cards one page at a time, with a button for the next page"""
+        end = start + self.RESULTS_PAGE_SIZE
+        for item in items[start:end]:
+            self._create_result_card(parent, item, highlight=highlight)
+
+        remaining = len(items) - end
+        if remaining <= 0:
+            return
+
+        def show_more():
+            more_button.destroy()
+            self._render_result_cards(parent, items, highlight, end)
+
+        more_button = ctk.CTkButton(
+            parent,
+            text=f"Show more ({remaining} remaining)",
+            height=40,
+            font=self._font(size=14),
+            fg_color=self.COLORS['bg_tertiary'],
+            hover_color=self.COLORS['border'],
+            corner_radius=10,
+            command=show_more
+        )
+        more_button.pack(fill="x", pady=8, padx=5)
 
     def _populate_comparisons(self, comparisons: dict):
         """Populate the comparison tab"""
+        self._build_tab("⚖️ Price Comparison")
+
         # Clear existing
         for widget in self.compare_scroll.winfo_children():
             widget.destroy()
@@ -1264,7 +1418,7 @@ class FinnDealFinderApp(ctk.CTk):
             placeholder = ctk.CTkLabel(
                 self.compare_scroll,
                 text="⚖️\n\nNo comparable items found.\nPrice comparisons require similar items to compare.",
-                font=ctk.CTkFont(size=16),
+                font=self._font(size=16),
                 text_color=self.COLORS['text_muted'],
                 justify="center"
             )
@@ -1276,11 +1430,13 @@ class FinnDealFinderApp(ctk.CTk):
 
     def _create_result_card(self, parent, item: dict, highlight: bool = False):
         """Create a result card"""
-        border_color = self.COLORS['accent_danger'] if highlight else self.COLORS['border']
+        colors = self.COLORS
+
+        border_color = colors['accent_danger'] if highlight else colors['border']
 
         card = ctk.CTkFrame(
             parent,
-            fg_color=self.COLORS['card_bg'],
+            fg_color=colors['card_bg'],
             corner_radius=12,
             border_width=2 if highlight else 1,
             border_color=border_color
@@ -1302,8 +1458,8 @@ class FinnDealFinderApp(ctk.CTk):
         title_label = ctk.CTkLabel(
             top_row,
             text=title,
-            font=ctk.CTkFont(family="Segoe UI", size=15, weight="bold"),
-            text_color=self.COLORS['text_primary'],
+            font=self._font(family="Segoe UI", size=15, weight="bold"),
+            text_color=colors['text_primary'],
             anchor="w"
         )
         title_label.pack(side="left", fill="x", expand=True)
@@ -1325,7 +1481,7 @@ class FinnDealFinderApp(ctk.CTk):
             score_label = ctk.CTkLabel(
                 score_badge,
                 text=f"🔥 {deal_score}%",
-                font=ctk.CTkFont(size=11, weight="bold"),
+                font=self._font(size=11, weight="bold"),
                 text_color="white"
             )
             score_label.pack(expand=True)
@@ -1340,8 +1496,8 @@ class FinnDealFinderApp(ctk.CTk):
         price_label = ctk.CTkLabel(
             details_frame,
             text=price_text,
-            font=ctk.CTkFont(size=18, weight="bold"),
-            text_color=self.COLORS['accent_success']
+            font=self._font(size=18, weight="bold"),
+            text_color=colors['accent_success']
         )
         price_label.pack(side="left")
 
@@ -1351,15 +1507,15 @@ class FinnDealFinderApp(ctk.CTk):
             diff = avg_price - price
             if diff > 0:
                 comparison_text = f"  📉 {diff:,.0f} kr under avg"
-                comparison_color = self.COLORS['accent_success']
+                comparison_color = colors['accent_success']
             else:
                 comparison_text = f"  📈 {abs(diff):,.0f} kr over avg"
-                comparison_color = self.COLORS['accent_danger']
+                comparison_color = colors['accent_danger']
 
             comparison_label = ctk.CTkLabel(
                 details_frame,
                 text=comparison_text,
-                font=ctk.CTkFont(size=12),
+                font=self._font(size=12),
                 text_color=comparison_color
             )
             comparison_label.pack(side="left", padx=(15, 0))
@@ -1375,8 +1531,8 @@ class FinnDealFinderApp(ctk.CTk):
         info_label = ctk.CTkLabel(
             details_frame,
             text=info_text,
-            font=ctk.CTkFont(size=12),
-            text_color=self.COLORS['text_secondary']
+            font=self._font(size=12),
+            text_color=colors['text_secondary']
         )
         info_label.pack(side="right")
 
@@ -1390,8 +1546,8 @@ class FinnDealFinderApp(ctk.CTk):
             posted_label = ctk.CTkLabel(
                 actions_frame,
                 text=f"📅 {posted}",
-                font=ctk.CTkFont(size=11),
-                text_color=self.COLORS['text_muted']
+                font=self._font(size=11),
+                text_color=colors['text_muted']
             )
             posted_label.pack(side="left")
 
@@ -1403,9 +1559,9 @@ class FinnDealFinderApp(ctk.CTk):
                 text="🔗 View on FINN",
                 width=120,
                 height=30,
-                font=ctk.CTkFont(size=11),
-                fg_color=self.COLORS['accent_primary'],
-                hover_color=self.COLORS['accent_secondary'],
+                font=self._font(size=11),
+                fg_color=colors['accent_primary'],
+                hover_color=colors['accent_secondary'],
                 corner_radius=6,
                 command=lambda u=url: webbrowser.open(u)
             )
@@ -1424,7 +1580,7 @@ class FinnDealFinderApp(ctk.CTk):
         header_label = ctk.CTkLabel(
             header_frame,
             text=f"⚖️ {group_name} ({len(items)} items)",
-            font=ctk.CTkFont(size=14, weight="bold"),
+            font=self._font(size=14, weight="bold"),
             text_color=self.COLORS['text_primary']
         )
         header_label.pack(pady=10, padx=15, anchor="w")
@@ -1439,11 +1595,13 @@ class FinnDealFinderApp(ctk.CTk):
 
     def _create_comparison_card(self, item: dict, is_best: bool = False):
         """Create a comparison card"""
-        border_color = self.COLORS['accent_success'] if is_best else self.COLORS['border']
+        colors = self.COLORS
+
+        border_color = colors['accent_success'] if is_best else colors['border']
 
         card = ctk.CTkFrame(
             self.compare_scroll,
-            fg_color=self.COLORS['card_bg'],
+            fg_color=colors['card_bg'],
             corner_radius=10,
             border_width=2 if is_best else 1,
             border_color=border_color
@@ -1458,8 +1616,8 @@ class FinnDealFinderApp(ctk.CTk):
             badge = ctk.CTkLabel(
                 content,
                 text="🏆 BEST PRICE",
-                font=ctk.CTkFont(size=10, weight="bold"),
-                text_color=self.COLORS['accent_success']
+                font=self._font(size=10, weight="bold"),
+                text_color=colors['accent_success']
             )
             badge.pack(anchor="w")
 
@@ -1471,18 +1629,18 @@ class FinnDealFinderApp(ctk.CTk):
         title_label = ctk.CTkLabel(
             row,
             text=title,
-            font=ctk.CTkFont(size=13),
-            text_color=self.COLORS['text_primary'],
+            font=self._font(size=13),
+            text_color=colors['text_primary'],
             anchor="w"
         )
         title_label.pack(side="left", fill="x", expand=True)
 
         price = item.get('price', 0)
-        price_color = self.COLORS['accent_success'] if is_best else self.COLORS['text_primary']
+        price_color = colors['accent_success'] if is_best else colors['text_primary']
         price_label = ctk.CTkLabel(
             row,
             text=f"{price:,.0f} kr",
-            font=ctk.CTkFont(size=14, weight="bold"),
+            font=self._font(size=14, weight="bold"),
             text_color=price_color
         )
         price_label.pack(side="right")
@@ -1558,7 +1716,11 @@ class FinnDealFinderApp(ctk.CTk):
 def main():
     """Main entry point"""
     app = FinnDealFinderApp()
-    app.mainloop()
+    try:
+        app.mainloop()
+    finally:
+        # Commit any queued price history before the process exits
+        app.data_manager.close()
 
 
 if __name__ == "__main__":
@@ -5,6 +5,8 @@ Handles all web scraping operations for FINN.no
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from bs4 import BeautifulSoup
 import re
 import time
@@ -15,6 +17,20 @@ import json
 from datetime import datetime
 from concurrent.futures import ThreadPoolExecutor, as_completed
 import threading
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+def create_http_adapter():
+    """Create an HTTP adapter with a pool sized for concurrent fetches and retries"""
+    retries = Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=['GET']
+    )
+    return HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=retries)
 
 
 class FinnScraper:
@@ -22,6 +38,9 @@ class FinnScraper:
     
     BASE_URL = "https://www.finn.no"
     
+    # Search result pages fetched at once after the first page
+    SEARCH_PAGE_WORKERS = 4
+    
     # User agents for rotation
     USER_AGENTS = [
         "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
@@ -33,6 +52,9 @@ class FinnScraper:
     
     def __init__(self):
         self.session = requests.Session()
+        adapter = create_http_adapter()
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
         self._stop_flag = threading.Event()
         self._lock = threading.Lock()
         
@@ -65,6 +87,10 @@ class FinnScraper:
         """Reset the stop flag"""
         self._stop_flag.clear()
         
+    def _pause(self, min_seconds: float, max_seconds: float):
+        """Wait a random rate-limit delay, returning early if stopped"""
+        self._stop_flag.wait(random.uniform(min_seconds, max_seconds))
+        
     def _build_search_url(self, params: dict) -> str:
         """Build the search URL from parameters"""
         url_base = params.get('url_base', 'https://www.finn.no/bap/forsale/search.html')
@@ -144,34 +170,7 @@ class FinnScraper:
             results['search_url'] = search_url
             
             max_results = params.get('max_results', 50)
-            items = []
-            page = 1
-            
-            while len(items) < max_results and not self._should_stop():
-                # Add page parameter
-                page_url = search_url
-                if page > 1:
-                    separator = '&' if '?' in search_url else '?'
-                    page_url = f"{search_url}{separator}page={page}"
-                
-                if progress_callback:
-                    progress_callback(
-                        len(items),
-                        max_results,
-                        f"(Page {page})"
-                    )
-                
-                # Fetch search results page
-                page_items = self._scrape_search_page(page_url)
-                
-                if not page_items:
-                    break  # No more results
-                
-                items.extend(page_items)
-                page += 1
-                
-                # Rate limiting - random delay
-                time.sleep(random.uniform(0.5, 1.5))
+            items = self._scrape_search_pages(search_url, max_results, progress_callback)
             
             # Trim to max results
             items = items[:max_results]
@@ -192,11 +191,69 @@ class FinnScraper:
             results['comparisons'] = self._find_comparisons(items)
             
         except Exception as e:
-            print(f"Search error: {e}")
+            logger.warning("Search error: %s", e)
             raise
             
         return results
         
+    def _page_url(self, search_url: str, page: int) -> str:
+        """Add the page parameter to a search URL"""
+        if page == 1:
+            return search_url
+        separator = '&' if '?' in search_url else '?'
+        return f"{search_url}{separator}page={page}"
+        
+    def _scrape_search_pages(
+        self,
+        search_url: str,
+        max_results: int,
+        progress_callback: Optional[Callable] = None
+    ) -> List[Dict]:
+        """
+        Scrape search result pages until max_results items are collected
+        
+        The first page is fetched alone to learn the page size; the pages
+        still needed are then fetched concurrently in small waves.
+        """
+        items = []
+        page = 1
+        page_size = 0
+        
+        with ThreadPoolExecutor(max_workers=self.SEARCH_PAGE_WORKERS) as executor:
+            while len(items) < max_results and not self._should_stop():
+                if page_size:
+                    remaining = -(-(max_results - len(items)) // page_size)
+                    wave = min(remaining, self.SEARCH_PAGE_WORKERS)
+                else:
+                    wave = 1
+                
+                if progress_callback:
+                    progress_callback(
+                        len(items),
+                        max_results,
+                        f"(Page {page})" if wave == 1 else f"(Pages {page}-{page + wave - 1})"
+                    )
+                
+                # Pages come back in order, so results keep FINN's ranking
+                urls = [self._page_url(search_url, p) for p in range(page, page + wave)]
+                exhausted = False
+                for page_items in executor.map(self._scrape_search_page, urls):
+                    if not page_items:
+                        exhausted = True  # No more results
+                        break
+                    items.extend(page_items)
+                    page_size = max(page_size, len(page_items))
+                
+                if exhausted:
+                    break
+                page += wave
+                
+                # Rate limiting - random delay before the next wave
+                if len(items) < max_results:
+                    self._pause(0.5, 1.5)
+        
+        return items
+        
     def _scrape_search_page(self, url: str) -> List[Dict]:
         """Scrape a single search results page"""
         items = []
@@ -209,7 +266,7 @@ class FinnScraper:
             )
             response.raise_for_status()
             
-            soup = BeautifulSoup(response.text, 'html.parser')
+            soup = BeautifulSoup(response.content, 'lxml')
             
             # Find all ad cards - FINN uses various class patterns
             ad_containers = soup.find_all('article', class_=re.compile(r'(sf-search-ad|ads__unit)'))
@@ -231,11 +288,11 @@ class FinnScraper:
                     if item:
                         items.append(item)
                 except Exception as e:
-                    print(f"Error parsing item: {e}")
+                    logger.warning("Error parsing item: %s", e)
                     continue
                     
         except requests.RequestException as e:
-            print(f"Request error for {url}: {e}")
+            logger.warning("Request error for %s: %s", url, e)
             
         return items
         
@@ -347,10 +404,10 @@ class FinnScraper:
                     item.update(details)
                     
                     # Small random delay for rate limiting
-                    time.sleep(random.uniform(0.2, 0.5))
+                    self._pause(0.2, 0.5)
                     
             except Exception as e:
-                print(f"Error fetching details for {item.get('id')}: {e}")
+                logger.warning("Error fetching details for %s: %s", item.get('id'), e)
             
             with self._lock:
                 completed += 1
@@ -370,7 +427,7 @@ class FinnScraper:
                     result = future.result()
                     detailed_items.append(result)
                 except Exception as e:
-                    print(f"Thread error: {e}")
+                    logger.warning("Thread error: %s", e)
                     detailed_items.append(futures[future])
         
         return detailed_items
@@ -394,7 +451,7 @@ class FinnScraper:
             )
             response.raise_for_status()
             
-            soup = BeautifulSoup(response.text, 'html.parser')
+            soup = BeautifulSoup(response.content, 'lxml')
             
             # Extract description
             desc_elem = soup.find(class_=re.compile(r'(description|body|content)'))
@@ -441,7 +498,7 @@ class FinnScraper:
                         details['images'].append(src)
                         
         except requests.RequestException as e:
-            print(f"Error fetching details from {url}: {e}")
+            logger.warning("Error fetching details from %s: %s", url, e)
             
         return details
         